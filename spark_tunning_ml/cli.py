@@ -95,9 +95,14 @@ def process_stage(sparkui, path_stage, stages, id, attemptid):
     list_raw_stages = []
 
     if data.check_empty_list(stages):
-        for stage in stages:
+        stage_responses = sparkui.get_stages_detail(
+            id_uri,
+            stages,
+            max_workers=config.get("internal_spark_ui_max_concurrency_stage"),
+        )
+
+        for stage, stage_response in zip(stages, stage_responses):
             logger.info(f"Processing stage {stage} for application {id}")
-            stage_response = sparkui.get_stage(id_uri, stage)
 
             data.list_to_json(stage_response, f"{path_stage}/raw-{stage}.json")
             list_raw_stages.append(stage_response[0].get("tasks"))
@@ -331,11 +336,11 @@ def process_applications(sparkui):
         return
 
     apps_limit = config.get("internal_spark_ui_apps_limit")
-    applications = sparkui.get_applications(apps_limit)
-    logger.info(f"Found {len(applications)} applications")
+    applications = sparkui.iter_applications(apps_limit)
 
     filter_users_pattern = config.get("spark_ui_api_endpoint_applications_filter_user")
     applications_ids = sparkui.get_ids_from_applications(applications, filter_users_pattern=filter_users_pattern)
+    logger.info(f"Found {len(applications_ids)} applications")
 
     debug_mode_enabled = config.get("internal_spark_ui_debug_mode_enabled")
     max_apps = config.get("internal_spark_ui_debug_mode_max_apps")
@@ -375,9 +380,10 @@ def process_milvus_data():
        a. Checks if the application ID exists in the audit table. If not, adds a dummy record to the audit table.
        b. Checks if the application has already been processed by querying the audit table. If so, logs a message and removes the application from the list.
     7. Checks if the list of applications is empty. If so, generates a random directory path for storing the milvus vectors.
-    8. Sets the concurrency limit for building vectors using the configuration value "internal_spark_ui_max_concurrency_vector".
-    9. Uses a ThreadPoolExecutor to asynchronously build vectors for each application in the list of applications.
-       The build_vector method of the Vectors object is called with the application, data source path, and path vector as arguments.
+    8. Sets the concurrency limit for building vectors to the configuration value "internal_spark_ui_max_concurrency_vector",
+       capped at the number of CPU cores (each worker process also runs "internal_vector_stage_read_workers" reader threads).
+    9. Builds the vectors for all the applications with the build_vector method of the Vectors object, which processes
+       the applications in parallel worker processes (up to the concurrency limit).
     10. Updates the application ID in the audit table with the result of building the vector.
     11. Loads the milvus vectors from the path vector into Milvus using the milvus_load_data method of the Vectors object.
     """
@@ -403,14 +409,12 @@ def process_milvus_data():
     if data.check_empty_list(list_apps):
         path_vector = data.generate_random_directory(config.get("internal_vector_output_path"), 1)[0]
 
-        concurrency_limit = config.get("internal_spark_ui_max_concurrency_vector")
-        with ThreadPoolExecutor(concurrency_limit) as vector:
-            futures_vector = [
-                vector.submit(vectors.build_vector, [app], data_source_path, path_vector) for app in list_apps
-            ]
+        # Building a vector is CPU-bound: more processes than cores only adds contention
+        concurrency_limit = min(config.get("internal_spark_ui_max_concurrency_vector"), os.cpu_count() or 1)
+        processed_apps = vectors.build_vector(list_apps, data_source_path, path_vector, max_workers=concurrency_limit)
 
-        for app in futures_vector:
-            audit.update_app_id(app.result()[0], 1)
+        for app in processed_apps:
+            audit.update_app_id(app, 1)
 
         vectors.milvus_load_data(path_vector)
 
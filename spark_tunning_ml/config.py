@@ -11,7 +11,7 @@ class Config:
 
     def _load_config(self):
         try:
-            with open(self.file_path, "r") as file:
+            with open(self.file_path, "rb") as file:
                 config_data = json.load(file)
             return config_data
         except FileNotFoundError:
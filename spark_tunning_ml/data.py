@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import concurrent.futures
+import functools
 import glob
 import json
 import os
@@ -14,6 +15,59 @@ import pandas as pd
 
 from spark_tunning_ml.logger import logger
 
+SPARK_UI_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%fGMT"
+
+BYTES_CONVERSION_FACTORS = {
+    "b": 1,
+    "k": 1024,
+    "kb": 1024,
+    "m": 1024**2,
+    "mb": 1024**2,
+    "g": 1024**3,
+    "gb": 1024**3,
+    "t": 1024**4,
+    "tb": 1024**4,
+    "p": 1024**5,
+    "pb": 1024**5,
+}
+
+
+def _scandir_files(directory, level=None):
+    """
+    Recursively yield the files under a directory using os.scandir.
+
+    Behaves like os.walk(directory) without following directory symlinks: the files of a directory are
+    yielded before descending into its subdirectories, and unreadable directories are skipped. The
+    entry types come from the directory listing itself, so no extra stat call is made per file.
+
+    Parameters:
+    - directory (str): The directory path.
+    - level (int, optional): If provided, directories whose path contains more than `level` separators
+      are not visited.
+
+    Returns:
+    - generator: os.DirEntry objects of the files found.
+    """
+    if level is not None and directory.count(os.sep) > level:
+        return
+
+    try:
+        with os.scandir(directory) as entries:
+            entries = list(entries)
+    except OSError:
+        return
+
+    subdirectories = []
+    for entry in entries:
+        if entry.is_dir():
+            if not entry.is_symlink():
+                subdirectories.append(entry.path)
+        else:
+            yield entry
+
+    for subdirectory in subdirectories:
+        yield from _scandir_files(subdirectory, level)
+
 
 class Data:
     @staticmethod
@@ -315,12 +369,9 @@ class Data:
         Returns:
         - int: The total number of files.
         """
-        total_files = 0
+        suffix = "" if extension is None else f".{extension}"
 
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if extension is None or file.endswith(f".{extension}"):
-                    total_files += 1
+        total_files = sum(1 for entry in _scandir_files(directory) if entry.name.endswith(suffix))
 
         return total_files
 
@@ -345,16 +396,9 @@ class Data:
         Note:
         - This function does not include directories in the result.
         """
-        file_list = []
-
-        for root, dirs, files in os.walk(directory):
-            current_level = root.count(os.sep)
-            if level is not None and current_level > level:
-                continue
+        suffix = "" if extension is None else f".{extension}"
 
-            for file in files:
-                if extension is None or file.endswith(f".{extension}"):
-                    file_list.append(os.path.join(root, file))
+        file_list = [entry.path for entry in _scandir_files(directory, level) if entry.name.endswith(suffix)]
 
         return file_list
 
@@ -421,16 +465,32 @@ class Data:
 
     @staticmethod
     def convert_date_to_epoch(date_string):
-        date_format = "%Y-%m-%dT%H:%M:%S.%fGMT"
-
         # Convert the string to a datetime object
-        dt_object = datetime.strptime(date_string, date_format)
+        dt_object = datetime.strptime(date_string, SPARK_UI_DATE_FORMAT)
 
         # Convert the datetime object to epoch time
         epoch_time = int(dt_object.replace(tzinfo=timezone.utc).timestamp())
 
         return epoch_time
 
+    @staticmethod
+    def convert_dates_to_epoch(dates):
+        """
+        Convert a column of Spark UI dates to epoch seconds.
+
+        Vectorized counterpart of convert_date_to_epoch: the whole column is parsed at once instead of
+        calling strptime row by row.
+
+        Args:
+            dates (pd.Series): Dates formatted as "%Y-%m-%dT%H:%M:%S.%fGMT".
+
+        Returns:
+            pd.Series: Epoch time in seconds (int64), with the same index as dates.
+        """
+        dt_series = pd.to_datetime(dates.astype(str), format=SPARK_UI_DATE_FORMAT, utc=True)
+
+        return (dt_series - pd.Timestamp(0, tz="UTC")) // pd.Timedelta(seconds=1)
+
     @staticmethod
     def move_directory(source_directory, destination_directory):
         """
@@ -599,22 +659,22 @@ class Data:
         return "".join(w.lower() if i == 0 else w.title() for i, w in enumerate(words))
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def convert_to_bytes(size_str):
-        # Define conversion factors
-        conversion_factors = {
-            'b': 1,
-            'k': 1024,
-            'kb': 1024,
-            'm': 1024 ** 2,
-            'mb': 1024 ** 2,
-            'g': 1024 ** 3,
-            'gb': 1024 ** 3,
-            't': 1024 ** 4,
-            'tb': 1024 ** 4,
-            'p': 1024 ** 5,
-            'pb': 1024 ** 5
-        }
+        """
+        Convert a size string such as "32k" or "4gb" to bytes.
+
+        The same handful of sizes ("0b", "4g", "32k"...) repeats across applications, so results are cached.
 
+        Args:
+            size_str (str): The size, a number followed by an optional unit (b, k, kb, m, mb, g, gb, t, tb, p, pb).
+
+        Returns:
+            int: The size in bytes.
+
+        Raises:
+            ValueError: If the unit is not supported.
+        """
         # Extract the numeric part and the unit
         numeric_part = ''.join(filter(str.isdigit, size_str))
         unit = ''.join(filter(str.isalpha, size_str)).lower()
@@ -623,8 +683,8 @@ class Data:
         numeric_value = int(numeric_part)
 
         # Calculate the bytes
-        if unit in conversion_factors:
-            return numeric_value * conversion_factors[unit]
+        if unit in BYTES_CONVERSION_FACTORS:
+            return numeric_value * BYTES_CONVERSION_FACTORS[unit]
         else:
             raise ValueError("Invalid unit. Supported units are b, kb, mb, gb, tb, k, m, g, t, p.")
 
@@ -26,8 +26,13 @@ class Embeddings:
         """
         Build embeddings for list of files
         """
+        return self.build_entities_from_frame(pd.read_csv(file_path), list_fields_schema)
+
+    def build_entities_from_frame(self, df, list_fields_schema=[]):
+        """
+        Build embeddings for the rows of an in-memory DataFrame
+        """
         logger.info("Starting build embeddings")
-        df = pd.read_csv(file_path)
 
         df.to_csv("/tmp/entities-raw.csv", index=False)
 
@@ -53,6 +58,13 @@ class Embeddings:
 
         return entities
 
+    def build_entities_chunks(self, df, list_fields_schema=[], chunk_size=10000):
+        """
+        Build embeddings for a DataFrame in chunks of chunk_size rows, yielding the entities of each chunk
+        """
+        for start in range(0, len(df), chunk_size):
+            yield self.build_entities_from_frame(df.iloc[start : start + chunk_size].copy(), list_fields_schema)
+
     def add_docs_to_milvus(self, docs, embeddings, collection_name, file_path):
         """
         Store embedding vectors for docs int Milvus DB, under collection_name.
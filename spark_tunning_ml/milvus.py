@@ -174,7 +174,7 @@ class MilvusHandler:
         except MilvusException as e:
             logger.error(f"Failed to create index: {e}")
 
-    def insert_data(self, data):
+    def insert_data(self, data, flush=True):
         result = None
 
         if not self.collection:
@@ -182,9 +182,18 @@ class MilvusHandler:
         try:
             logger.info("Start insert")
             self.collection.insert(data)
-            self.collection.flush()
+            if flush:
+                self.collection.flush()
             logger.info("End insert")
         except MilvusException as e:
             logger.error(f"Failed to insert data: {e}")
 
         return result
+
+    def flush(self):
+        if not self.collection:
+            raise MilvusException("Collection not initialized. Create a collection first.")
+        try:
+            self.collection.flush()
+        except MilvusException as e:
+            logger.error(f"Failed to flush data: {e}")
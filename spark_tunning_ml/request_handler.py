@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+
+import ijson
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from spark_tunning_ml.config import config
 from spark_tunning_ml.logger import logger
 
 
@@ -10,15 +18,41 @@ class RequestHandler:
     A simple request wrapper for making HTTP requests using the requests library.
     """
 
-    def __init__(self, base_url):
+    def __init__(self, base_url, pool_maxsize=None):
         """
         Initialize the RequestWrapper with a base URL.
 
         Args:
             base_url (str): The base URL for the requests.
+            pool_maxsize (int, optional): Maximum number of pooled connections per host. Defaults to
+                "internal_spark_ui_max_concurrency_api" x "internal_spark_ui_max_concurrency_stage", the most
+                requests in flight when every application thread fans out its stage requests at once.
         """
         self.base_url = base_url
 
+        if pool_maxsize is None:
+            pool_maxsize = config.get("internal_spark_ui_max_concurrency_api") * config.get(
+                "internal_spark_ui_max_concurrency_stage"
+            )
+        self.pool_maxsize = pool_maxsize
+
+        # Transient overload answers are retried with exponential backoff, honouring Retry-After. Only GET is
+        # retried, and the last response is returned (not raised) so raise_for_status reports it as before.
+        retry = Retry(
+            total=config.get("internal_spark_ui_request_retries"),
+            backoff_factor=config.get("internal_spark_ui_request_backoff_factor"),
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+        # Keep-alive connections are reused across requests instead of opening a new one per call
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def request(self, method, endpoint, params=None, data=None, json=None):
         """
         Make an HTTP request to the specified endpoint.
@@ -37,9 +71,9 @@ class RequestHandler:
         logger.info(f"Making {method} request to {url}.")
 
         if method.upper() == "GET":
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params)
         elif method.upper() == "POST":
-            response = requests.post(url, data=data, json=json)
+            response = self.session.post(url, data=data, json=json)
         else:
             raise ValueError(
                 "Unsupported HTTP method. Supported methods: 'GET', 'POST'.",
@@ -47,4 +81,63 @@ class RequestHandler:
 
         response.raise_for_status()
 
-        return response.json()
+        # Decode the raw body with orjson rather than the stdlib json used by response.json()
+        return orjson.loads(response.content)
+
+    def request_many(self, method, endpoints, params=None, max_workers=None):
+        """
+        Make the same HTTP request to several endpoints concurrently over the shared session.
+
+        Args:
+            method (str): The HTTP method to use ('GET' or 'POST').
+            endpoints (list): The endpoints to send the request to.
+            params (dict, optional): Query parameters for every request.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to the
+                "internal_spark_ui_max_concurrency_stage" configuration value.
+
+        Returns:
+            list: The JSON content of each response, in the same order as endpoints.
+        """
+        endpoints = list(endpoints)
+        if not endpoints:
+            return []
+
+        max_workers = min(max_workers or config.get("internal_spark_ui_max_concurrency_stage"), len(endpoints))
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(lambda endpoint: self.request(method, endpoint, params=params), endpoints))
+
+    def request_stream_events(self, endpoint, params=None):
+        """
+        Make a GET request and yield the ijson parse events of the JSON response as it arrives.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            params (dict, optional): Query parameters for the request.
+
+        Yields:
+            tuple: Each (prefix, event, value) ijson parse event, without holding the whole response in memory.
+        """
+        url = f"{self.base_url}{endpoint}"
+        logger.info(f"Making streamed GET request to {url}.")
+
+        response = self.session.get(url, params=params, stream=True)
+        with closing(response):
+            response.raise_for_status()
+            # Let urllib3 undo any Content-Encoding (gzip) before ijson reads the raw stream
+            response.raw.decode_content = True
+            yield from ijson.parse(response.raw, use_float=True)
+
+    def request_stream(self, endpoint, prefix="item", params=None):
+        """
+        Make a GET request and parse the JSON response incrementally as it arrives.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            prefix (str, optional): The ijson prefix of the items to yield. Defaults to top-level array elements.
+            params (dict, optional): Query parameters for the request.
+
+        Yields:
+            Any: Each JSON item matching the prefix, without holding the whole response in memory.
+        """
+        yield from ijson.items(self.request_stream_events(endpoint, params=params), prefix)
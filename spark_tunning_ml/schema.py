@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import functools
+import json
+
+import fastjsonschema
 import jsonschema
 from jsonschema.exceptions import FormatError, SchemaError, UnknownType, ValidationError
 
@@ -14,6 +18,25 @@ class SchemaValidator:
         """
         self.schema = schema
         self.validator = jsonschema.Draft7Validator(self.schema)
+        # Compiled on first use, so an invalid schema still raises from validate()
+        self._compiled_validate = None
+
+    def _compile(self):
+        """
+        Meta-validate the schema and compile it into a specialized validation function.
+
+        Returns:
+            Callable: The fastjsonschema validation function for the schema.
+
+        Raises:
+            jsonschema.exceptions.SchemaError: If there is an issue with the schema.
+        """
+        self.validator.check_schema(self.schema)
+        try:
+            # use_default=False: validation must never write default values into the instance
+            return fastjsonschema.compile(self.schema, use_default=False)
+        except fastjsonschema.JsonSchemaDefinitionException as e:
+            raise SchemaError(str(e)) from e
 
     def validate(self, instance):
         """
@@ -29,7 +52,14 @@ class SchemaValidator:
             jsonschema.exceptions.UnknownType: If an unknown type is encountered in the schema.
         """
         try:
-            jsonschema.validate(instance=instance, schema=self.schema)
+            if self._compiled_validate is None:
+                self._compiled_validate = self._compile()
+            try:
+                self._compiled_validate(instance)
+            except fastjsonschema.JsonSchemaValueException:
+                # Slow path, only on failure: jsonschema has the final say (fastjsonschema is stricter on e.g.
+                # "format" and "pattern") and reports the detailed error
+                self.validator.validate(instance)
         except (
             ValidationError,
             SchemaError,
@@ -50,3 +80,24 @@ class SchemaValidator:
             Iterator[jsonschema.exceptions.ValidationError]: Iterator of validation errors.
         """
         return self.validator.iter_errors(instance)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_validator(schema_key):
+    return SchemaValidator(json.loads(schema_key))
+
+
+def get_validator(schema):
+    """
+    Get a shared SchemaValidator for the given schema.
+
+    Equal schemas (regardless of key order) share one validator, so the schema is meta-validated and
+    compiled only once.
+
+    Args:
+        schema (dict): The JSON schema to validate against.
+
+    Returns:
+        SchemaValidator: The cached validator for the schema.
+    """
+    return _get_validator(json.dumps(schema, sort_keys=True))
@@ -1,12 +1,911 @@
 from __future__ import annotations
 
+import itertools
 import re
 from typing import Dict, List, Union
 
+import ijson
+
 from spark_tunning_ml.config import config
 from spark_tunning_ml.logger import logger
 from spark_tunning_ml.request_handler import RequestHandler
-from spark_tunning_ml.schema import SchemaValidator
+from spark_tunning_ml.schema import get_validator
+
+APPLICATIONS_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Generated schema for Root",
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "id": {"type": "string"},
+            "name": {"type": "string"},
+            "attempts": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "startTime": {"type": "string"},
+                        "endTime": {"type": "string"},
+                        "lastUpdated": {"type": "string"},
+                        "duration": {"type": "number"},
+                        "sparkUser": {"type": "string"},
+                        "completed": {"type": "boolean"},
+                        "appSparkVersion": {"type": "string"},
+                        "startTimeEpoch": {"type": "number"},
+                        "endTimeEpoch": {"type": "number"},
+                        "lastUpdatedEpoch": {"type": "number"},
+                    },
+                    "required": [
+                        "startTime",
+                        "endTime",
+                        "lastUpdated",
+                        "duration",
+                        "sparkUser",
+                        "completed",
+                        "appSparkVersion",
+                        "startTimeEpoch",
+                        "endTimeEpoch",
+                        "lastUpdatedEpoch",
+                    ],
+                },
+            },
+        },
+        "required": ["id", "name", "attempts"],
+    },
+}
+
+TASK_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Generated schema for Root",
+    "type": "object",
+    "properties": {
+        "taskId": {"type": "number"},
+        "index": {"type": "number"},
+        "attempt": {"type": "number"},
+        "launchTime": {"type": "string"},
+        "duration": {"type": "number"},
+        "executorId": {"type": "string"},
+        "host": {"type": "string"},
+        "status": {"type": "string"},
+        "taskLocality": {"type": "string"},
+        "speculative": {"type": "boolean"},
+        "accumulatorUpdates": {"type": "array", "items": {}},
+        "taskMetrics": {
+            "type": "object",
+            "properties": {
+                "executorDeserializeTime": {"type": "number"},
+                "executorDeserializeCpuTime": {"type": "number"},
+                "executorRunTime": {"type": "number"},
+                "executorCpuTime": {"type": "number"},
+                "resultSize": {"type": "number"},
+                "jvmGcTime": {"type": "number"},
+                "resultSerializationTime": {"type": "number"},
+                "memoryBytesSpilled": {"type": "number"},
+                "diskBytesSpilled": {"type": "number"},
+                "peakExecutionMemory": {"type": "number"},
+                "inputMetrics": {
+                    "type": "object",
+                    "properties": {
+                        "bytesRead": {"type": "number"},
+                        "recordsRead": {"type": "number"},
+                    },
+                    "required": ["bytesRead", "recordsRead"],
+                },
+                "outputMetrics": {
+                    "type": "object",
+                    "properties": {
+                        "bytesWritten": {"type": "number"},
+                        "recordsWritten": {"type": "number"},
+                    },
+                    "required": ["bytesWritten", "recordsWritten"],
+                },
+                "shuffleReadMetrics": {
+                    "type": "object",
+                    "properties": {
+                        "remoteBlocksFetched": {"type": "number"},
+                        "localBlocksFetched": {"type": "number"},
+                        "fetchWaitTime": {"type": "number"},
+                        "remoteBytesRead": {"type": "number"},
+                        "remoteBytesReadToDisk": {"type": "number"},
+                        "localBytesRead": {"type": "number"},
+                        "recordsRead": {"type": "number"},
+                    },
+                    "required": [
+                        "remoteBlocksFetched",
+                        "localBlocksFetched",
+                        "fetchWaitTime",
+                        "remoteBytesRead",
+                        "remoteBytesReadToDisk",
+                        "localBytesRead",
+                        "recordsRead",
+                    ],
+                },
+                "shuffleWriteMetrics": {
+                    "type": "object",
+                    "properties": {
+                        "bytesWritten": {"type": "number"},
+                        "writeTime": {"type": "number"},
+                        "recordsWritten": {"type": "number"},
+                    },
+                    "required": ["bytesWritten", "writeTime", "recordsWritten"],
+                },
+            },
+            "required": [
+                "executorDeserializeTime",
+                "executorDeserializeCpuTime",
+                "executorRunTime",
+                "executorCpuTime",
+                "resultSize",
+                "jvmGcTime",
+                "resultSerializationTime",
+                "memoryBytesSpilled",
+                "diskBytesSpilled",
+                "peakExecutionMemory",
+                "inputMetrics",
+                "outputMetrics",
+                "shuffleReadMetrics",
+                "shuffleWriteMetrics",
+            ],
+        },
+    },
+    "required": [
+        "taskId",
+        "index",
+        "attempt",
+        "launchTime",
+        "duration",
+        "executorId",
+        "host",
+        "status",
+        "taskLocality",
+        "speculative",
+        "accumulatorUpdates",
+        "taskMetrics",
+    ],
+}
+
+EXECUTORS_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Generated schema for Root",
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "id": {"type": "string"},
+            "hostPort": {"type": "string"},
+            "isActive": {"type": "boolean"},
+            "rddBlocks": {"type": "number"},
+            "memoryUsed": {"type": "number"},
+            "diskUsed": {"type": "number"},
+            "totalCores": {"type": "number"},
+            "maxTasks": {"type": "number"},
+            "activeTasks": {"type": "number"},
+            "failedTasks": {"type": "number"},
+            "completedTasks": {"type": "number"},
+            "totalTasks": {"type": "number"},
+            "totalDuration": {"type": "number"},
+            "totalGCTime": {"type": "number"},
+            "totalInputBytes": {"type": "number"},
+            "totalShuffleRead": {"type": "number"},
+            "totalShuffleWrite": {"type": "number"},
+            "isBlacklisted": {"type": "boolean"},
+            "maxMemory": {"type": "number"},
+            "addTime": {"type": "string"},
+            "executorLogs": {
+                "type": "object",
+                "properties": {
+                    "stdout": {"type": "string"},
+                    "stderr": {"type": "string"},
+                },
+                "required": [],
+            },
+            "memoryMetrics": {
+                "type": "object",
+                "properties": {
+                    "usedOnHeapStorageMemory": {"type": "number"},
+                    "usedOffHeapStorageMemory": {"type": "number"},
+                    "totalOnHeapStorageMemory": {"type": "number"},
+                    "totalOffHeapStorageMemory": {"type": "number"},
+                },
+                "required": [
+                    "usedOnHeapStorageMemory",
+                    "usedOffHeapStorageMemory",
+                    "totalOnHeapStorageMemory",
+                    "totalOffHeapStorageMemory",
+                ],
+            },
+            "blacklistedInStages": {"type": "array", "items": {}},
+        },
+        "required": [
+            "id",
+            "hostPort",
+            "isActive",
+            "rddBlocks",
+            "memoryUsed",
+            "diskUsed",
+            "totalCores",
+            "maxTasks",
+            "activeTasks",
+            "failedTasks",
+            "completedTasks",
+            "totalTasks",
+            "totalDuration",
+            "totalGCTime",
+            "totalInputBytes",
+            "totalShuffleRead",
+            "totalShuffleWrite",
+            "isBlacklisted",
+            "maxMemory",
+            "addTime",
+            "executorLogs",
+            "memoryMetrics",
+            "blacklistedInStages",
+        ],
+    },
+}
+
+JOBS_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Generated schema for Root",
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "jobId": {"type": "number"},
+            "name": {"type": "string"},
+            "submissionTime": {"type": "string"},
+            "completionTime": {"type": "string"},
+            "stageIds": {"type": "array", "items": {"type": "number"}},
+            "status": {"type": "string"},
+            "numTasks": {"type": "number"},
+            "numActiveTasks": {"type": "number"},
+            "numCompletedTasks": {"type": "number"},
+            "numSkippedTasks": {"type": "number"},
+            "numFailedTasks": {"type": "number"},
+            "numKilledTasks": {"type": "number"},
+            "numCompletedIndices": {"type": "number"},
+            "numActiveStages": {"type": "number"},
+            "numCompletedStages": {"type": "number"},
+            "numSkippedStages": {"type": "number"},
+            "numFailedStages": {"type": "number"},
+            "killedTasksSummary": {
+                "type": "object",
+                "properties": {},
+                "required": [],
+            },
+        },
+        "required": [
+            "jobId",
+            "name",
+            "submissionTime",
+            "completionTime",
+            "stageIds",
+            "status",
+            "numTasks",
+            "numActiveTasks",
+            "numCompletedTasks",
+            "numSkippedTasks",
+            "numFailedTasks",
+            "numKilledTasks",
+            "numCompletedIndices",
+            "numActiveStages",
+            "numCompletedStages",
+            "numSkippedStages",
+            "numFailedStages",
+            "killedTasksSummary",
+        ],
+    },
+}
+
+STAGES_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Generated schema for Root",
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "status": {"type": "string"},
+            "stageId": {"type": "number"},
+            "attemptId": {"type": "number"},
+            "numTasks": {"type": "number"},
+            "numActiveTasks": {"type": "number"},
+            "numCompleteTasks": {"type": "number"},
+            "numFailedTasks": {"type": "number"},
+            "numKilledTasks": {"type": "number"},
+            "numCompletedIndices": {"type": "number"},
+            "executorRunTime": {"type": "number"},
+            "executorCpuTime": {"type": "number"},
+            "submissionTime": {"type": "string"},
+            "firstTaskLaunchedTime": {"type": "string"},
+            "completionTime": {"type": "string"},
+            "inputBytes": {"type": "number"},
+            "inputRecords": {"type": "number"},
+            "outputBytes": {"type": "number"},
+            "outputRecords": {"type": "number"},
+            "shuffleReadBytes": {"type": "number"},
+            "shuffleReadRecords": {"type": "number"},
+            "shuffleWriteBytes": {"type": "number"},
+            "shuffleWriteRecords": {"type": "number"},
+            "memoryBytesSpilled": {"type": "number"},
+            "diskBytesSpilled": {"type": "number"},
+            "name": {"type": "string"},
+            "details": {"type": "string"},
+            "schedulingPool": {"type": "string"},
+            "rddIds": {"type": "array", "items": {"type": "number"}},
+            "accumulatorUpdates": {"type": "array", "items": {}},
+            "killedTasksSummary": {
+                "type": "object",
+                "properties": {},
+                "required": [],
+            },
+        },
+        "required": [
+            "status",
+            "stageId",
+            "attemptId",
+            "numTasks",
+            "numActiveTasks",
+            "numCompleteTasks",
+            "numFailedTasks",
+            "numKilledTasks",
+            "numCompletedIndices",
+            "executorRunTime",
+            "executorCpuTime",
+            "submissionTime",
+            "firstTaskLaunchedTime",
+            "completionTime",
+            "inputBytes",
+            "inputRecords",
+            "outputBytes",
+            "outputRecords",
+            "shuffleReadBytes",
+            "shuffleReadRecords",
+            "shuffleWriteBytes",
+            "shuffleWriteRecords",
+            "memoryBytesSpilled",
+            "diskBytesSpilled",
+            "name",
+            "details",
+            "schedulingPool",
+            "rddIds",
+            "accumulatorUpdates",
+            "killedTasksSummary",
+        ],
+    },
+}
+
+STAGE_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Generated schema for Root",
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "status": {"type": "string"},
+            "stageId": {"type": "number"},
+            "attemptId": {"type": "number"},
+            "numTasks": {"type": "number"},
+            "numActiveTasks": {"type": "number"},
+            "numCompleteTasks": {"type": "number"},
+            "numFailedTasks": {"type": "number"},
+            "numKilledTasks": {"type": "number"},
+            "numCompletedIndices": {"type": "number"},
+            "executorRunTime": {"type": "number"},
+            "executorCpuTime": {"type": "number"},
+            "submissionTime": {"type": "string"},
+            "firstTaskLaunchedTime": {"type": "string"},
+            "completionTime": {"type": "string"},
+            "inputBytes": {"type": "number"},
+            "inputRecords": {"type": "number"},
+            "outputBytes": {"type": "number"},
+            "outputRecords": {"type": "number"},
+            "shuffleReadBytes": {"type": "number"},
+            "shuffleReadRecords": {"type": "number"},
+            "shuffleWriteBytes": {"type": "number"},
+            "shuffleWriteRecords": {"type": "number"},
+            "memoryBytesSpilled": {"type": "number"},
+            "diskBytesSpilled": {"type": "number"},
+            "name": {"type": "string"},
+            "details": {"type": "string"},
+            "schedulingPool": {"type": "string"},
+            "rddIds": {"type": "array", "items": {"type": "number"}},
+            "accumulatorUpdates": {"type": "array", "items": {}},
+            "tasks": {
+                "type": "object",
+                "properties": {
+                    "1": {
+                        "type": "object",
+                        "properties": {
+                            "taskId": {"type": "number"},
+                            "index": {"type": "number"},
+                            "attempt": {"type": "number"},
+                            "launchTime": {"type": "string"},
+                            "duration": {"type": "number"},
+                            "executorId": {"type": "string"},
+                            "host": {"type": "string"},
+                            "status": {"type": "string"},
+                            "taskLocality": {"type": "string"},
+                            "speculative": {"type": "boolean"},
+                            "accumulatorUpdates": {
+                                "type": "array",
+                                "items": {},
+                            },
+                            "taskMetrics": {
+                                "type": "object",
+                                "properties": {
+                                    "executorDeserializeTime": {"type": "number"},
+                                    "executorDeserializeCpuTime": {"type": "number"},
+                                    "executorRunTime": {"type": "number"},
+                                    "executorCpuTime": {"type": "number"},
+                                    "resultSize": {"type": "number"},
+                                    "jvmGcTime": {"type": "number"},
+                                    "resultSerializationTime": {"type": "number"},
+                                    "memoryBytesSpilled": {"type": "number"},
+                                    "diskBytesSpilled": {"type": "number"},
+                                    "peakExecutionMemory": {"type": "number"},
+                                    "inputMetrics": {
+                                        "type": "object",
+                                        "properties": {
+                                            "bytesRead": {"type": "number"},
+                                            "recordsRead": {"type": "number"},
+                                        },
+                                        "required": [
+                                            "bytesRead",
+                                            "recordsRead",
+                                        ],
+                                    },
+                                    "outputMetrics": {
+                                        "type": "object",
+                                        "properties": {
+                                            "bytesWritten": {"type": "number"},
+                                            "recordsWritten": {"type": "number"},
+                                        },
+                                        "required": [
+                                            "bytesWritten",
+                                            "recordsWritten",
+                                        ],
+                                    },
+                                    "shuffleReadMetrics": {
+                                        "type": "object",
+                                        "properties": {
+                                            "remoteBlocksFetched": {"type": "number"},
+                                            "localBlocksFetched": {"type": "number"},
+                                            "fetchWaitTime": {"type": "number"},
+                                            "remoteBytesRead": {"type": "number"},
+                                            "remoteBytesReadToDisk": {"type": "number"},
+                                            "localBytesRead": {"type": "number"},
+                                            "recordsRead": {"type": "number"},
+                                        },
+                                        "required": [
+                                            "remoteBlocksFetched",
+                                            "localBlocksFetched",
+                                            "fetchWaitTime",
+                                            "remoteBytesRead",
+                                            "remoteBytesReadToDisk",
+                                            "localBytesRead",
+                                            "recordsRead",
+                                        ],
+                                    },
+                                    "shuffleWriteMetrics": {
+                                        "type": "object",
+                                        "properties": {
+                                            "bytesWritten": {"type": "number"},
+                                            "writeTime": {"type": "number"},
+                                            "recordsWritten": {"type": "number"},
+                                        },
+                                        "required": [
+                                            "bytesWritten",
+                                            "writeTime",
+                                            "recordsWritten",
+                                        ],
+                                    },
+                                },
+                                "required": [
+                                    "executorDeserializeTime",
+                                    "executorDeserializeCpuTime",
+                                    "executorRunTime",
+                                    "executorCpuTime",
+                                    "resultSize",
+                                    "jvmGcTime",
+                                    "resultSerializationTime",
+                                    "memoryBytesSpilled",
+                                    "diskBytesSpilled",
+                                    "peakExecutionMemory",
+                                    "inputMetrics",
+                                    "outputMetrics",
+                                    "shuffleReadMetrics",
+                                    "shuffleWriteMetrics",
+                                ],
+                            },
+                        },
+                        "required": [
+                            "taskId",
+                            "index",
+                            "attempt",
+                            "launchTime",
+                            "duration",
+                            "executorId",
+                            "host",
+                            "status",
+                            "taskLocality",
+                            "speculative",
+                            "accumulatorUpdates",
+                        ],
+                    },
+                },
+            },
+            "executorSummary": {
+                "type": "object",
+                "properties": {
+                    "1": {
+                        "type": "object",
+                        "properties": {
+                            "taskTime": {"type": "number"},
+                            "failedTasks": {"type": "number"},
+                            "succeededTasks": {"type": "number"},
+                            "killedTasks": {"type": "number"},
+                            "inputBytes": {"type": "number"},
+                            "inputRecords": {"type": "number"},
+                            "outputBytes": {"type": "number"},
+                            "outputRecords": {"type": "number"},
+                            "shuffleRead": {"type": "number"},
+                            "shuffleReadRecords": {"type": "number"},
+                            "shuffleWrite": {"type": "number"},
+                            "shuffleWriteRecords": {"type": "number"},
+                            "memoryBytesSpilled": {"type": "number"},
+                            "diskBytesSpilled": {"type": "number"},
+                            "isBlacklistedForStage": {"type": "boolean"},
+                        },
+                        "required": [
+                            "taskTime",
+                            "failedTasks",
+                            "succeededTasks",
+                            "killedTasks",
+                            "inputBytes",
+                            "inputRecords",
+                            "outputBytes",
+                            "outputRecords",
+                            "shuffleRead",
+                            "shuffleReadRecords",
+                            "shuffleWrite",
+                            "shuffleWriteRecords",
+                            "memoryBytesSpilled",
+                            "diskBytesSpilled",
+                            "isBlacklistedForStage",
+                        ],
+                    },
+                },
+            },
+            "killedTasksSummary": {
+                "type": "object",
+                "properties": {},
+                "required": [],
+            },
+        },
+        "required": [
+            "status",
+            "stageId",
+            "attemptId",
+            "numTasks",
+            "numActiveTasks",
+            "numCompleteTasks",
+            "numFailedTasks",
+            "numKilledTasks",
+            "numCompletedIndices",
+            "executorRunTime",
+            "executorCpuTime",
+            "submissionTime",
+            "firstTaskLaunchedTime",
+            "completionTime",
+            "inputBytes",
+            "inputRecords",
+            "outputBytes",
+            "outputRecords",
+            "shuffleReadBytes",
+            "shuffleReadRecords",
+            "shuffleWriteBytes",
+            "shuffleWriteRecords",
+            "memoryBytesSpilled",
+            "diskBytesSpilled",
+            "name",
+            "details",
+            "schedulingPool",
+            "rddIds",
+            "accumulatorUpdates",
+            "tasks",
+            "executorSummary",
+            "killedTasksSummary",
+        ],
+    },
+}
+
+TASK_SUMMARY_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Generated schema for Root",
+    "type": "object",
+    "properties": {
+        "quantiles": {"type": "array", "items": {"type": "number"}},
+        "executorDeserializeTime": {
+            "type": "array",
+            "items": {"type": "number"},
+        },
+        "executorDeserializeCpuTime": {
+            "type": "array",
+            "items": {"type": "number"},
+        },
+        "executorRunTime": {"type": "array", "items": {"type": "number"}},
+        "executorCpuTime": {"type": "array", "items": {"type": "number"}},
+        "resultSize": {"type": "array", "items": {"type": "number"}},
+        "jvmGcTime": {"type": "array", "items": {"type": "number"}},
+        "resultSerializationTime": {
+            "type": "array",
+            "items": {"type": "number"},
+        },
+        "gettingResultTime": {"type": "array", "items": {"type": "number"}},
+        "schedulerDelay": {"type": "array", "items": {"type": "number"}},
+        "peakExecutionMemory": {"type": "array", "items": {"type": "number"}},
+        "memoryBytesSpilled": {"type": "array", "items": {"type": "number"}},
+        "diskBytesSpilled": {"type": "array", "items": {"type": "number"}},
+        "inputMetrics": {
+            "type": "object",
+            "properties": {
+                "bytesRead": {"type": "array", "items": {"type": "number"}},
+                "recordsRead": {"type": "array", "items": {"type": "number"}},
+            },
+            "required": ["bytesRead", "recordsRead"],
+        },
+        "outputMetrics": {
+            "type": "object",
+            "properties": {
+                "bytesWritten": {"type": "array", "items": {"type": "number"}},
+                "recordsWritten": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                },
+            },
+            "required": ["bytesWritten", "recordsWritten"],
+        },
+        "shuffleReadMetrics": {
+            "type": "object",
+            "properties": {
+                "readBytes": {"type": "array", "items": {"type": "number"}},
+                "readRecords": {"type": "array", "items": {"type": "number"}},
+                "remoteBlocksFetched": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                },
+                "localBlocksFetched": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                },
+                "fetchWaitTime": {"type": "array", "items": {"type": "number"}},
+                "remoteBytesRead": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                },
+                "remoteBytesReadToDisk": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                },
+                "totalBlocksFetched": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                },
+            },
+            "required": [
+                "readBytes",
+                "readRecords",
+                "remoteBlocksFetched",
+                "localBlocksFetched",
+                "fetchWaitTime",
+                "remoteBytesRead",
+                "remoteBytesReadToDisk",
+                "totalBlocksFetched",
+            ],
+        },
+        "shuffleWriteMetrics": {
+            "type": "object",
+            "properties": {
+                "writeBytes": {"type": "array", "items": {"type": "number"}},
+                "writeRecords": {"type": "array", "items": {"type": "number"}},
+                "writeTime": {"type": "array", "items": {"type": "number"}},
+            },
+            "required": ["writeBytes", "writeRecords", "writeTime"],
+        },
+    },
+    "required": [
+        "quantiles",
+        "executorDeserializeTime",
+        "executorDeserializeCpuTime",
+        "executorRunTime",
+        "executorCpuTime",
+        "resultSize",
+        "jvmGcTime",
+        "resultSerializationTime",
+        "gettingResultTime",
+        "schedulerDelay",
+        "peakExecutionMemory",
+        "memoryBytesSpilled",
+        "diskBytesSpilled",
+        "inputMetrics",
+        "outputMetrics",
+        "shuffleReadMetrics",
+        "shuffleWriteMetrics",
+    ],
+}
+
+TASK_LIST_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Generated schema for Root",
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "taskId": {"type": "number"},
+            "index": {"type": "number"},
+            "attempt": {"type": "number"},
+            "launchTime": {"type": "string"},
+            "duration": {"type": "number"},
+            "executorId": {"type": "string"},
+            "host": {"type": "string"},
+            "status": {"type": "string"},
+            "taskLocality": {"type": "string"},
+            "speculative": {"type": "boolean"},
+            "accumulatorUpdates": {"type": "array", "items": {}},
+            "taskMetrics": {
+                "type": "object",
+                "properties": {
+                    "executorDeserializeTime": {"type": "number"},
+                    "executorDeserializeCpuTime": {"type": "number"},
+                    "executorRunTime": {"type": "number"},
+                    "executorCpuTime": {"type": "number"},
+                    "resultSize": {"type": "number"},
+                    "jvmGcTime": {"type": "number"},
+                    "resultSerializationTime": {"type": "number"},
+                    "memoryBytesSpilled": {"type": "number"},
+                    "diskBytesSpilled": {"type": "number"},
+                    "peakExecutionMemory": {"type": "number"},
+                    "inputMetrics": {
+                        "type": "object",
+                        "properties": {
+                            "bytesRead": {"type": "number"},
+                            "recordsRead": {"type": "number"},
+                        },
+                        "required": ["bytesRead", "recordsRead"],
+                    },
+                    "outputMetrics": {
+                        "type": "object",
+                        "properties": {
+                            "bytesWritten": {"type": "number"},
+                            "recordsWritten": {"type": "number"},
+                        },
+                        "required": ["bytesWritten", "recordsWritten"],
+                    },
+                    "shuffleReadMetrics": {
+                        "type": "object",
+                        "properties": {
+                            "remoteBlocksFetched": {"type": "number"},
+                            "localBlocksFetched": {"type": "number"},
+                            "fetchWaitTime": {"type": "number"},
+                            "remoteBytesRead": {"type": "number"},
+                            "remoteBytesReadToDisk": {"type": "number"},
+                            "localBytesRead": {"type": "number"},
+                            "recordsRead": {"type": "number"},
+                        },
+                        "required": [
+                            "remoteBlocksFetched",
+                            "localBlocksFetched",
+                            "fetchWaitTime",
+                            "remoteBytesRead",
+                            "remoteBytesReadToDisk",
+                            "localBytesRead",
+                            "recordsRead",
+                        ],
+                    },
+                    "shuffleWriteMetrics": {
+                        "type": "object",
+                        "properties": {
+                            "bytesWritten": {"type": "number"},
+                            "writeTime": {"type": "number"},
+                            "recordsWritten": {"type": "number"},
+                        },
+                        "required": [
+                            "bytesWritten",
+                            "writeTime",
+                            "recordsWritten",
+                        ],
+                    },
+                },
+                "required": [
+                    "executorDeserializeTime",
+                    "executorDeserializeCpuTime",
+                    "executorRunTime",
+                    "executorCpuTime",
+                    "resultSize",
+                    "jvmGcTime",
+                    "resultSerializationTime",
+                    "memoryBytesSpilled",
+                    "diskBytesSpilled",
+                    "peakExecutionMemory",
+                    "inputMetrics",
+                    "outputMetrics",
+                    "shuffleReadMetrics",
+                    "shuffleWriteMetrics",
+                ],
+            },
+        },
+        "required": [
+            "taskId",
+            "index",
+            "attempt",
+            "launchTime",
+            "duration",
+            "executorId",
+            "host",
+            "status",
+            "taskLocality",
+            "speculative",
+            "accumulatorUpdates",
+        ],
+    },
+}
+
+ENVIRONMENT_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Generated schema for Root",
+    "type": "object",
+    "properties": {
+        "runtime": {
+            "type": "object",
+            "properties": {
+                "javaVersion": {"type": "string"},
+                "javaHome": {"type": "string"},
+                "scalaVersion": {"type": "string"},
+            },
+            "required": ["javaVersion", "javaHome", "scalaVersion"],
+        },
+        "sparkProperties": {
+            "type": "array",
+            "items": {"type": "array", "items": {"type": "string"}},
+        },
+        "systemProperties": {
+            "type": "array",
+            "items": {"type": "array", "items": {"type": "string"}},
+        },
+        "classpathEntries": {
+            "type": "array",
+            "items": {"type": "array", "items": {"type": "string"}},
+        },
+    },
+    "required": [
+        "runtime",
+        "sparkProperties",
+        "systemProperties",
+        "classpathEntries",
+    ],
+}
+
+VERSION_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Generated schema for Root",
+    "type": "object",
+    "properties": {"spark": {"type": "string"}},
+    "required": ["spark"],
+}
+
+# Validators are built once at import and shared by every SparkUIHandler instance
+_APPLICATIONS_VALIDATOR = get_validator(APPLICATIONS_SCHEMA)
+_APPLICATION_VALIDATOR = get_validator(APPLICATIONS_SCHEMA["items"])
+_TASK_VALIDATOR = get_validator(TASK_SCHEMA)
+_EXECUTORS_VALIDATOR = get_validator(EXECUTORS_SCHEMA)
+_JOBS_VALIDATOR = get_validator(JOBS_SCHEMA)
+_STAGES_VALIDATOR = get_validator(STAGES_SCHEMA)
+_STAGE_VALIDATOR = get_validator(STAGE_SCHEMA)
+_TASK_SUMMARY_VALIDATOR = get_validator(TASK_SUMMARY_SCHEMA)
+_TASK_LIST_VALIDATOR = get_validator(TASK_LIST_SCHEMA)
+_ENVIRONMENT_VALIDATOR = get_validator(ENVIRONMENT_SCHEMA)
+_VERSION_VALIDATOR = get_validator(VERSION_SCHEMA)
 
 
 class SparkUIHandler:
@@ -20,6 +919,17 @@ class SparkUIHandler:
         self.base_url = base_url
         self.request_wrapper = RequestHandler(base_url)
 
+        # Endpoint templates are resolved once; each getter only formats its IDs into them
+        self._endpoint_applications = config.get("spark_ui_api_endpoint_applications").format
+        self._endpoint_executors = config.get("spark_ui_api_endpoint_executors").format
+        self._endpoint_jobs = config.get("spark_ui_api_endpoint_jobs").format
+        self._endpoint_stages = config.get("spark_ui_api_endpoint_stages").format
+        self._endpoint_stage = config.get("spark_ui_api_endpoint_stage").format
+        self._endpoint_stage_tasksummary = config.get("spark_ui_api_endpoint_stage_tasksummary").format
+        self._endpoint_stage_tasklist = config.get("spark_ui_api_endpoint_stage_tasklist").format
+        self._endpoint_environment = config.get("spark_ui_api_endpoint_environment").format
+        self._endpoint_version = config.get("spark_ui_api_endpoint_version")
+
     def get_applications(self, apps_limit=10000):
         """
         Fetch information about Spark applications.
@@ -31,205 +941,73 @@ class SparkUIHandler:
             requests.Response: The response object containing the JSON data.
         """
 
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "Generated schema for Root",
-            "type": "array",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "id": {"type": "string"},
-                    "name": {"type": "string"},
-                    "attempts": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "startTime": {"type": "string"},
-                                "endTime": {"type": "string"},
-                                "lastUpdated": {"type": "string"},
-                                "duration": {"type": "number"},
-                                "sparkUser": {"type": "string"},
-                                "completed": {"type": "boolean"},
-                                "appSparkVersion": {"type": "string"},
-                                "startTimeEpoch": {"type": "number"},
-                                "endTimeEpoch": {"type": "number"},
-                                "lastUpdatedEpoch": {"type": "number"},
-                            },
-                            "required": [
-                                "startTime",
-                                "endTime",
-                                "lastUpdated",
-                                "duration",
-                                "sparkUser",
-                                "completed",
-                                "appSparkVersion",
-                                "startTimeEpoch",
-                                "endTimeEpoch",
-                                "lastUpdatedEpoch",
-                            ],
-                        },
-                    },
-                },
-                "required": ["id", "name", "attempts"],
-            },
-        }
-
-        endpoint = config.get("spark_ui_api_endpoint_applications").format(
+        endpoint = self._endpoint_applications(
             apps_limit=apps_limit,
         )
         applications = self.request_wrapper.request("GET", endpoint)
 
-        schema = SchemaValidator(schema)
-        schema.validate(applications)
+        _APPLICATIONS_VALIDATOR.validate(applications)
 
         return applications
 
+    def iter_applications(self, apps_limit=10000):
+        """
+        Stream information about Spark applications, validating each one as it is parsed.
+
+        Args:
+            apps_limit (int): The maximum number of applications to fetch.
+
+        Yields:
+            dict: Each application, without holding the whole response in memory.
+        """
+        endpoint = self._endpoint_applications(apps_limit=apps_limit)
+        events = self.request_wrapper.request_stream_events(endpoint)
+
+        # Peek at the top-level value so a non-array body (e.g. an error object) fails like get_applications
+        first_event = next(events)
+        events = itertools.chain([first_event], events)
+        if first_event[1] != "start_array":
+            _APPLICATIONS_VALIDATOR.validate(next(ijson.items(events, "")))
+
+        for application in ijson.items(events, "item"):
+            _APPLICATION_VALIDATOR.validate(application)
+            yield application
+
     def get_ids_from_applications(self, applications, filter_users_pattern=None):
         """
         Get a list of IDs from a list of applications.
 
         Args:
             applications (list): A list of applications.
+            filter_users_pattern (str, optional): Regular expression the attempt "sparkUser" must match.
+                If None or empty, every attempt is kept.
 
         Returns:
-            list: A list of IDs.
+            list: A list of {application ID: highest attempt ID} dictionaries.
         """
+        # An empty pattern matches every user, so skip the regex entirely; otherwise compile it once
+        match_user = re.compile(filter_users_pattern).match if filter_users_pattern else None
 
         ids = []
 
         for app in applications:
-            attemptids = [
-                int(attempt.get("attemptId", 0))
-                for attempt in app["attempts"]
-                if re.match(filter_users_pattern, attempt.get("sparkUser"))
-            ]
-
-            if attemptids:
-                ids.append({app["id"]: max(attemptids)})
+            attempts = app["attempts"]
+            if match_user is not None:
+                attempts = [attempt for attempt in attempts if match_user(attempt.get("sparkUser"))]
+
+            if attempts:
+                ids.append({app["id"]: max(int(attempt.get("attemptId", 0)) for attempt in attempts)})
             else:
                 logger.warning(f"Discarding {app['id']}. Not matching filter users {filter_users_pattern}")
         return ids
 
     def get_tasks_from_stages_normalized(self, raw_stages):
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "Generated schema for Root",
-            "type": "object",
-            "properties": {
-                "taskId": {"type": "number"},
-                "index": {"type": "number"},
-                "attempt": {"type": "number"},
-                "launchTime": {"type": "string"},
-                "duration": {"type": "number"},
-                "executorId": {"type": "string"},
-                "host": {"type": "string"},
-                "status": {"type": "string"},
-                "taskLocality": {"type": "string"},
-                "speculative": {"type": "boolean"},
-                "accumulatorUpdates": {"type": "array", "items": {}},
-                "taskMetrics": {
-                    "type": "object",
-                    "properties": {
-                        "executorDeserializeTime": {"type": "number"},
-                        "executorDeserializeCpuTime": {"type": "number"},
-                        "executorRunTime": {"type": "number"},
-                        "executorCpuTime": {"type": "number"},
-                        "resultSize": {"type": "number"},
-                        "jvmGcTime": {"type": "number"},
-                        "resultSerializationTime": {"type": "number"},
-                        "memoryBytesSpilled": {"type": "number"},
-                        "diskBytesSpilled": {"type": "number"},
-                        "peakExecutionMemory": {"type": "number"},
-                        "inputMetrics": {
-                            "type": "object",
-                            "properties": {
-                                "bytesRead": {"type": "number"},
-                                "recordsRead": {"type": "number"},
-                            },
-                            "required": ["bytesRead", "recordsRead"],
-                        },
-                        "outputMetrics": {
-                            "type": "object",
-                            "properties": {
-                                "bytesWritten": {"type": "number"},
-                                "recordsWritten": {"type": "number"},
-                            },
-                            "required": ["bytesWritten", "recordsWritten"],
-                        },
-                        "shuffleReadMetrics": {
-                            "type": "object",
-                            "properties": {
-                                "remoteBlocksFetched": {"type": "number"},
-                                "localBlocksFetched": {"type": "number"},
-                                "fetchWaitTime": {"type": "number"},
-                                "remoteBytesRead": {"type": "number"},
-                                "remoteBytesReadToDisk": {"type": "number"},
-                                "localBytesRead": {"type": "number"},
-                                "recordsRead": {"type": "number"},
-                            },
-                            "required": [
-                                "remoteBlocksFetched",
-                                "localBlocksFetched",
-                                "fetchWaitTime",
-                                "remoteBytesRead",
-                                "remoteBytesReadToDisk",
-                                "localBytesRead",
-                                "recordsRead",
-                            ],
-                        },
-                        "shuffleWriteMetrics": {
-                            "type": "object",
-                            "properties": {
-                                "bytesWritten": {"type": "number"},
-                                "writeTime": {"type": "number"},
-                                "recordsWritten": {"type": "number"},
-                            },
-                            "required": ["bytesWritten", "writeTime", "recordsWritten"],
-                        },
-                    },
-                    "required": [
-                        "executorDeserializeTime",
-                        "executorDeserializeCpuTime",
-                        "executorRunTime",
-                        "executorCpuTime",
-                        "resultSize",
-                        "jvmGcTime",
-                        "resultSerializationTime",
-                        "memoryBytesSpilled",
-                        "diskBytesSpilled",
-                        "peakExecutionMemory",
-                        "inputMetrics",
-                        "outputMetrics",
-                        "shuffleReadMetrics",
-                        "shuffleWriteMetrics",
-                    ],
-                },
-            },
-            "required": [
-                "taskId",
-                "index",
-                "attempt",
-                "launchTime",
-                "duration",
-                "executorId",
-                "host",
-                "status",
-                "taskLocality",
-                "speculative",
-                "accumulatorUpdates",
-                "taskMetrics",
-            ],
-        }
-
-        schema = SchemaValidator(schema)
-
         task_metrics = []
 
         for stage in raw_stages:
             for task_id, task_value in stage.items():
                 if "taskMetrics" in task_value:
-                    schema.validate(task_value)
+                    _TASK_VALIDATOR.validate(task_value)
                     task_metrics.append(task_value)
 
         return task_metrics
@@ -244,93 +1022,10 @@ class SparkUIHandler:
         Returns:
             Response: The response object from the executors endpoint.
         """
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "Generated schema for Root",
-            "type": "array",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "id": {"type": "string"},
-                    "hostPort": {"type": "string"},
-                    "isActive": {"type": "boolean"},
-                    "rddBlocks": {"type": "number"},
-                    "memoryUsed": {"type": "number"},
-                    "diskUsed": {"type": "number"},
-                    "totalCores": {"type": "number"},
-                    "maxTasks": {"type": "number"},
-                    "activeTasks": {"type": "number"},
-                    "failedTasks": {"type": "number"},
-                    "completedTasks": {"type": "number"},
-                    "totalTasks": {"type": "number"},
-                    "totalDuration": {"type": "number"},
-                    "totalGCTime": {"type": "number"},
-                    "totalInputBytes": {"type": "number"},
-                    "totalShuffleRead": {"type": "number"},
-                    "totalShuffleWrite": {"type": "number"},
-                    "isBlacklisted": {"type": "boolean"},
-                    "maxMemory": {"type": "number"},
-                    "addTime": {"type": "string"},
-                    "executorLogs": {
-                        "type": "object",
-                        "properties": {
-                            "stdout": {"type": "string"},
-                            "stderr": {"type": "string"},
-                        },
-                        "required": [],
-                    },
-                    "memoryMetrics": {
-                        "type": "object",
-                        "properties": {
-                            "usedOnHeapStorageMemory": {"type": "number"},
-                            "usedOffHeapStorageMemory": {"type": "number"},
-                            "totalOnHeapStorageMemory": {"type": "number"},
-                            "totalOffHeapStorageMemory": {"type": "number"},
-                        },
-                        "required": [
-                            "usedOnHeapStorageMemory",
-                            "usedOffHeapStorageMemory",
-                            "totalOnHeapStorageMemory",
-                            "totalOffHeapStorageMemory",
-                        ],
-                    },
-                    "blacklistedInStages": {"type": "array", "items": {}},
-                },
-                "required": [
-                    "id",
-                    "hostPort",
-                    "isActive",
-                    "rddBlocks",
-                    "memoryUsed",
-                    "diskUsed",
-                    "totalCores",
-                    "maxTasks",
-                    "activeTasks",
-                    "failedTasks",
-                    "completedTasks",
-                    "totalTasks",
-                    "totalDuration",
-                    "totalGCTime",
-                    "totalInputBytes",
-                    "totalShuffleRead",
-                    "totalShuffleWrite",
-                    "isBlacklisted",
-                    "maxMemory",
-                    "addTime",
-                    "executorLogs",
-                    "memoryMetrics",
-                    "blacklistedInStages",
-                ],
-            },
-        }
-
-        endpoint = config.get(
-            "spark_ui_api_endpoint_executors",
-        ).format(app_id=app_id)
+        endpoint = self._endpoint_executors(app_id=app_id)
         executors = self.request_wrapper.request("GET", endpoint)
 
-        schema = SchemaValidator(schema)
-        schema.validate(executors)
+        _EXECUTORS_VALIDATOR.validate(executors)
 
         return executors
 
@@ -344,66 +1039,10 @@ class SparkUIHandler:
         Returns:
             Response: The response object from the jobs endpoint.
         """
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "Generated schema for Root",
-            "type": "array",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "jobId": {"type": "number"},
-                    "name": {"type": "string"},
-                    "submissionTime": {"type": "string"},
-                    "completionTime": {"type": "string"},
-                    "stageIds": {"type": "array", "items": {"type": "number"}},
-                    "status": {"type": "string"},
-                    "numTasks": {"type": "number"},
-                    "numActiveTasks": {"type": "number"},
-                    "numCompletedTasks": {"type": "number"},
-                    "numSkippedTasks": {"type": "number"},
-                    "numFailedTasks": {"type": "number"},
-                    "numKilledTasks": {"type": "number"},
-                    "numCompletedIndices": {"type": "number"},
-                    "numActiveStages": {"type": "number"},
-                    "numCompletedStages": {"type": "number"},
-                    "numSkippedStages": {"type": "number"},
-                    "numFailedStages": {"type": "number"},
-                    "killedTasksSummary": {
-                        "type": "object",
-                        "properties": {},
-                        "required": [],
-                    },
-                },
-                "required": [
-                    "jobId",
-                    "name",
-                    "submissionTime",
-                    "completionTime",
-                    "stageIds",
-                    "status",
-                    "numTasks",
-                    "numActiveTasks",
-                    "numCompletedTasks",
-                    "numSkippedTasks",
-                    "numFailedTasks",
-                    "numKilledTasks",
-                    "numCompletedIndices",
-                    "numActiveStages",
-                    "numCompletedStages",
-                    "numSkippedStages",
-                    "numFailedStages",
-                    "killedTasksSummary",
-                ],
-            },
-        }
-
-        endpoint = config.get(
-            "spark_ui_api_endpoint_jobs",
-        ).format(app_id=app_id)
+        endpoint = self._endpoint_jobs(app_id=app_id)
         jobs = self.request_wrapper.request("GET", endpoint)
 
-        schema = SchemaValidator(schema)
-        schema.validate(jobs)
+        _JOBS_VALIDATOR.validate(jobs)
 
         return jobs
 
@@ -431,90 +1070,10 @@ class SparkUIHandler:
         Returns:
             Response: The response object from the stages endpoint.
         """
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "Generated schema for Root",
-            "type": "array",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "status": {"type": "string"},
-                    "stageId": {"type": "number"},
-                    "attemptId": {"type": "number"},
-                    "numTasks": {"type": "number"},
-                    "numActiveTasks": {"type": "number"},
-                    "numCompleteTasks": {"type": "number"},
-                    "numFailedTasks": {"type": "number"},
-                    "numKilledTasks": {"type": "number"},
-                    "numCompletedIndices": {"type": "number"},
-                    "executorRunTime": {"type": "number"},
-                    "executorCpuTime": {"type": "number"},
-                    "submissionTime": {"type": "string"},
-                    "firstTaskLaunchedTime": {"type": "string"},
-                    "completionTime": {"type": "string"},
-                    "inputBytes": {"type": "number"},
-                    "inputRecords": {"type": "number"},
-                    "outputBytes": {"type": "number"},
-                    "outputRecords": {"type": "number"},
-                    "shuffleReadBytes": {"type": "number"},
-                    "shuffleReadRecords": {"type": "number"},
-                    "shuffleWriteBytes": {"type": "number"},
-                    "shuffleWriteRecords": {"type": "number"},
-                    "memoryBytesSpilled": {"type": "number"},
-                    "diskBytesSpilled": {"type": "number"},
-                    "name": {"type": "string"},
-                    "details": {"type": "string"},
-                    "schedulingPool": {"type": "string"},
-                    "rddIds": {"type": "array", "items": {"type": "number"}},
-                    "accumulatorUpdates": {"type": "array", "items": {}},
-                    "killedTasksSummary": {
-                        "type": "object",
-                        "properties": {},
-                        "required": [],
-                    },
-                },
-                "required": [
-                    "status",
-                    "stageId",
-                    "attemptId",
-                    "numTasks",
-                    "numActiveTasks",
-                    "numCompleteTasks",
-                    "numFailedTasks",
-                    "numKilledTasks",
-                    "numCompletedIndices",
-                    "executorRunTime",
-                    "executorCpuTime",
-                    "submissionTime",
-                    "firstTaskLaunchedTime",
-                    "completionTime",
-                    "inputBytes",
-                    "inputRecords",
-                    "outputBytes",
-                    "outputRecords",
-                    "shuffleReadBytes",
-                    "shuffleReadRecords",
-                    "shuffleWriteBytes",
-                    "shuffleWriteRecords",
-                    "memoryBytesSpilled",
-                    "diskBytesSpilled",
-                    "name",
-                    "details",
-                    "schedulingPool",
-                    "rddIds",
-                    "accumulatorUpdates",
-                    "killedTasksSummary",
-                ],
-            },
-        }
-
-        endpoint = config.get(
-            "spark_ui_api_endpoint_stages",
-        ).format(app_id=app_id)
+        endpoint = self._endpoint_stages(app_id=app_id)
         stages = self.request_wrapper.request("GET", endpoint)
 
-        schema = SchemaValidator(schema)
-        schema.validate(stages)
+        _STAGES_VALIDATOR.validate(stages)
 
         return stages
 
@@ -540,10 +1099,7 @@ class SparkUIHandler:
         Returns:
             int: The attempt ID from the stage.
         """
-        if stage:
-            return stage[0].get("attemptId")
-        else:
-            return None
+        return stage[0].get("attemptId") if stage else None
 
     def get_stage(self, app_id, stage_id):
         """
@@ -556,262 +1112,37 @@ class SparkUIHandler:
         Returns:
             Response: The response object from the stage endpoint.
         """
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "Generated schema for Root",
-            "type": "array",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "status": {"type": "string"},
-                    "stageId": {"type": "number"},
-                    "attemptId": {"type": "number"},
-                    "numTasks": {"type": "number"},
-                    "numActiveTasks": {"type": "number"},
-                    "numCompleteTasks": {"type": "number"},
-                    "numFailedTasks": {"type": "number"},
-                    "numKilledTasks": {"type": "number"},
-                    "numCompletedIndices": {"type": "number"},
-                    "executorRunTime": {"type": "number"},
-                    "executorCpuTime": {"type": "number"},
-                    "submissionTime": {"type": "string"},
-                    "firstTaskLaunchedTime": {"type": "string"},
-                    "completionTime": {"type": "string"},
-                    "inputBytes": {"type": "number"},
-                    "inputRecords": {"type": "number"},
-                    "outputBytes": {"type": "number"},
-                    "outputRecords": {"type": "number"},
-                    "shuffleReadBytes": {"type": "number"},
-                    "shuffleReadRecords": {"type": "number"},
-                    "shuffleWriteBytes": {"type": "number"},
-                    "shuffleWriteRecords": {"type": "number"},
-                    "memoryBytesSpilled": {"type": "number"},
-                    "diskBytesSpilled": {"type": "number"},
-                    "name": {"type": "string"},
-                    "details": {"type": "string"},
-                    "schedulingPool": {"type": "string"},
-                    "rddIds": {"type": "array", "items": {"type": "number"}},
-                    "accumulatorUpdates": {"type": "array", "items": {}},
-                    "tasks": {
-                        "type": "object",
-                        "properties": {
-                            "1": {
-                                "type": "object",
-                                "properties": {
-                                    "taskId": {"type": "number"},
-                                    "index": {"type": "number"},
-                                    "attempt": {"type": "number"},
-                                    "launchTime": {"type": "string"},
-                                    "duration": {"type": "number"},
-                                    "executorId": {"type": "string"},
-                                    "host": {"type": "string"},
-                                    "status": {"type": "string"},
-                                    "taskLocality": {"type": "string"},
-                                    "speculative": {"type": "boolean"},
-                                    "accumulatorUpdates": {
-                                        "type": "array",
-                                        "items": {},
-                                    },
-                                    "taskMetrics": {
-                                        "type": "object",
-                                        "properties": {
-                                            "executorDeserializeTime": {"type": "number"},
-                                            "executorDeserializeCpuTime": {"type": "number"},
-                                            "executorRunTime": {"type": "number"},
-                                            "executorCpuTime": {"type": "number"},
-                                            "resultSize": {"type": "number"},
-                                            "jvmGcTime": {"type": "number"},
-                                            "resultSerializationTime": {"type": "number"},
-                                            "memoryBytesSpilled": {"type": "number"},
-                                            "diskBytesSpilled": {"type": "number"},
-                                            "peakExecutionMemory": {"type": "number"},
-                                            "inputMetrics": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "bytesRead": {"type": "number"},
-                                                    "recordsRead": {"type": "number"},
-                                                },
-                                                "required": [
-                                                    "bytesRead",
-                                                    "recordsRead",
-                                                ],
-                                            },
-                                            "outputMetrics": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "bytesWritten": {"type": "number"},
-                                                    "recordsWritten": {"type": "number"},
-                                                },
-                                                "required": [
-                                                    "bytesWritten",
-                                                    "recordsWritten",
-                                                ],
-                                            },
-                                            "shuffleReadMetrics": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "remoteBlocksFetched": {"type": "number"},
-                                                    "localBlocksFetched": {"type": "number"},
-                                                    "fetchWaitTime": {"type": "number"},
-                                                    "remoteBytesRead": {"type": "number"},
-                                                    "remoteBytesReadToDisk": {"type": "number"},
-                                                    "localBytesRead": {"type": "number"},
-                                                    "recordsRead": {"type": "number"},
-                                                },
-                                                "required": [
-                                                    "remoteBlocksFetched",
-                                                    "localBlocksFetched",
-                                                    "fetchWaitTime",
-                                                    "remoteBytesRead",
-                                                    "remoteBytesReadToDisk",
-                                                    "localBytesRead",
-                                                    "recordsRead",
-                                                ],
-                                            },
-                                            "shuffleWriteMetrics": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "bytesWritten": {"type": "number"},
-                                                    "writeTime": {"type": "number"},
-                                                    "recordsWritten": {"type": "number"},
-                                                },
-                                                "required": [
-                                                    "bytesWritten",
-                                                    "writeTime",
-                                                    "recordsWritten",
-                                                ],
-                                            },
-                                        },
-                                        "required": [
-                                            "executorDeserializeTime",
-                                            "executorDeserializeCpuTime",
-                                            "executorRunTime",
-                                            "executorCpuTime",
-                                            "resultSize",
-                                            "jvmGcTime",
-                                            "resultSerializationTime",
-                                            "memoryBytesSpilled",
-                                            "diskBytesSpilled",
-                                            "peakExecutionMemory",
-                                            "inputMetrics",
-                                            "outputMetrics",
-                                            "shuffleReadMetrics",
-                                            "shuffleWriteMetrics",
-                                        ],
-                                    },
-                                },
-                                "required": [
-                                    "taskId",
-                                    "index",
-                                    "attempt",
-                                    "launchTime",
-                                    "duration",
-                                    "executorId",
-                                    "host",
-                                    "status",
-                                    "taskLocality",
-                                    "speculative",
-                                    "accumulatorUpdates",
-                                ],
-                            },
-                        },
-                    },
-                    "executorSummary": {
-                        "type": "object",
-                        "properties": {
-                            "1": {
-                                "type": "object",
-                                "properties": {
-                                    "taskTime": {"type": "number"},
-                                    "failedTasks": {"type": "number"},
-                                    "succeededTasks": {"type": "number"},
-                                    "killedTasks": {"type": "number"},
-                                    "inputBytes": {"type": "number"},
-                                    "inputRecords": {"type": "number"},
-                                    "outputBytes": {"type": "number"},
-                                    "outputRecords": {"type": "number"},
-                                    "shuffleRead": {"type": "number"},
-                                    "shuffleReadRecords": {"type": "number"},
-                                    "shuffleWrite": {"type": "number"},
-                                    "shuffleWriteRecords": {"type": "number"},
-                                    "memoryBytesSpilled": {"type": "number"},
-                                    "diskBytesSpilled": {"type": "number"},
-                                    "isBlacklistedForStage": {"type": "boolean"},
-                                },
-                                "required": [
-                                    "taskTime",
-                                    "failedTasks",
-                                    "succeededTasks",
-                                    "killedTasks",
-                                    "inputBytes",
-                                    "inputRecords",
-                                    "outputBytes",
-                                    "outputRecords",
-                                    "shuffleRead",
-                                    "shuffleReadRecords",
-                                    "shuffleWrite",
-                                    "shuffleWriteRecords",
-                                    "memoryBytesSpilled",
-                                    "diskBytesSpilled",
-                                    "isBlacklistedForStage",
-                                ],
-                            },
-                        },
-                    },
-                    "killedTasksSummary": {
-                        "type": "object",
-                        "properties": {},
-                        "required": [],
-                    },
-                },
-                "required": [
-                    "status",
-                    "stageId",
-                    "attemptId",
-                    "numTasks",
-                    "numActiveTasks",
-                    "numCompleteTasks",
-                    "numFailedTasks",
-                    "numKilledTasks",
-                    "numCompletedIndices",
-                    "executorRunTime",
-                    "executorCpuTime",
-                    "submissionTime",
-                    "firstTaskLaunchedTime",
-                    "completionTime",
-                    "inputBytes",
-                    "inputRecords",
-                    "outputBytes",
-                    "outputRecords",
-                    "shuffleReadBytes",
-                    "shuffleReadRecords",
-                    "shuffleWriteBytes",
-                    "shuffleWriteRecords",
-                    "memoryBytesSpilled",
-                    "diskBytesSpilled",
-                    "name",
-                    "details",
-                    "schedulingPool",
-                    "rddIds",
-                    "accumulatorUpdates",
-                    "tasks",
-                    "executorSummary",
-                    "killedTasksSummary",
-                ],
-            },
-        }
-
-        endpoint = config.get("spark_ui_api_endpoint_stage").format(
+        endpoint = self._endpoint_stage(
             app_id=app_id,
             stage_id=stage_id,
         )
         stage = self.request_wrapper.request("GET", endpoint)
 
-        schema = SchemaValidator(schema)
-        schema.validate(stage)
+        _STAGE_VALIDATOR.validate(stage)
 
         return stage
 
+    def get_stages_detail(self, app_id, stage_ids, max_workers=None):
+        """
+        Get information about several stages of an application, fetching them concurrently.
+
+        Args:
+            app_id (str): The ID of the application.
+            stage_ids (list): The IDs of the stages.
+            max_workers (int, optional): Maximum number of concurrent requests.
+
+        Returns:
+            list: The response of the stage endpoint for each stage, in the same order as stage_ids.
+        """
+        endpoints = [self._endpoint_stage(app_id=app_id, stage_id=stage_id) for stage_id in stage_ids]
+
+        stages = self.request_wrapper.request_many("GET", endpoints, max_workers=max_workers)
+
+        for stage in stages:
+            _STAGE_VALIDATOR.validate(stage)
+
+        return stages
+
     def get_stage_attempt(self, app_id, stage_id, stage_attempt_id):
         """
         Get information about a specific stage attempt in an application.
@@ -839,130 +1170,14 @@ class SparkUIHandler:
         Returns:
             Response: The response object from the task summary endpoint.
         """
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "Generated schema for Root",
-            "type": "object",
-            "properties": {
-                "quantiles": {"type": "array", "items": {"type": "number"}},
-                "executorDeserializeTime": {
-                    "type": "array",
-                    "items": {"type": "number"},
-                },
-                "executorDeserializeCpuTime": {
-                    "type": "array",
-                    "items": {"type": "number"},
-                },
-                "executorRunTime": {"type": "array", "items": {"type": "number"}},
-                "executorCpuTime": {"type": "array", "items": {"type": "number"}},
-                "resultSize": {"type": "array", "items": {"type": "number"}},
-                "jvmGcTime": {"type": "array", "items": {"type": "number"}},
-                "resultSerializationTime": {
-                    "type": "array",
-                    "items": {"type": "number"},
-                },
-                "gettingResultTime": {"type": "array", "items": {"type": "number"}},
-                "schedulerDelay": {"type": "array", "items": {"type": "number"}},
-                "peakExecutionMemory": {"type": "array", "items": {"type": "number"}},
-                "memoryBytesSpilled": {"type": "array", "items": {"type": "number"}},
-                "diskBytesSpilled": {"type": "array", "items": {"type": "number"}},
-                "inputMetrics": {
-                    "type": "object",
-                    "properties": {
-                        "bytesRead": {"type": "array", "items": {"type": "number"}},
-                        "recordsRead": {"type": "array", "items": {"type": "number"}},
-                    },
-                    "required": ["bytesRead", "recordsRead"],
-                },
-                "outputMetrics": {
-                    "type": "object",
-                    "properties": {
-                        "bytesWritten": {"type": "array", "items": {"type": "number"}},
-                        "recordsWritten": {
-                            "type": "array",
-                            "items": {"type": "number"},
-                        },
-                    },
-                    "required": ["bytesWritten", "recordsWritten"],
-                },
-                "shuffleReadMetrics": {
-                    "type": "object",
-                    "properties": {
-                        "readBytes": {"type": "array", "items": {"type": "number"}},
-                        "readRecords": {"type": "array", "items": {"type": "number"}},
-                        "remoteBlocksFetched": {
-                            "type": "array",
-                            "items": {"type": "number"},
-                        },
-                        "localBlocksFetched": {
-                            "type": "array",
-                            "items": {"type": "number"},
-                        },
-                        "fetchWaitTime": {"type": "array", "items": {"type": "number"}},
-                        "remoteBytesRead": {
-                            "type": "array",
-                            "items": {"type": "number"},
-                        },
-                        "remoteBytesReadToDisk": {
-                            "type": "array",
-                            "items": {"type": "number"},
-                        },
-                        "totalBlocksFetched": {
-                            "type": "array",
-                            "items": {"type": "number"},
-                        },
-                    },
-                    "required": [
-                        "readBytes",
-                        "readRecords",
-                        "remoteBlocksFetched",
-                        "localBlocksFetched",
-                        "fetchWaitTime",
-                        "remoteBytesRead",
-                        "remoteBytesReadToDisk",
-                        "totalBlocksFetched",
-                    ],
-                },
-                "shuffleWriteMetrics": {
-                    "type": "object",
-                    "properties": {
-                        "writeBytes": {"type": "array", "items": {"type": "number"}},
-                        "writeRecords": {"type": "array", "items": {"type": "number"}},
-                        "writeTime": {"type": "array", "items": {"type": "number"}},
-                    },
-                    "required": ["writeBytes", "writeRecords", "writeTime"],
-                },
-            },
-            "required": [
-                "quantiles",
-                "executorDeserializeTime",
-                "executorDeserializeCpuTime",
-                "executorRunTime",
-                "executorCpuTime",
-                "resultSize",
-                "jvmGcTime",
-                "resultSerializationTime",
-                "gettingResultTime",
-                "schedulerDelay",
-                "peakExecutionMemory",
-                "memoryBytesSpilled",
-                "diskBytesSpilled",
-                "inputMetrics",
-                "outputMetrics",
-                "shuffleReadMetrics",
-                "shuffleWriteMetrics",
-            ],
-        }
-
-        endpoint = config.get("spark_ui_api_endpoint_stage_tasksummary").format(
+        endpoint = self._endpoint_stage_tasksummary(
             app_id=app_id,
             stage_id=stage_id,
             stage_attempt_id=stage_attempt_id,
         )
         tasksummary = self.request_wrapper.request("GET", endpoint)
 
-        schema = SchemaValidator(schema)
-        schema.validate(tasksummary)
+        _TASK_SUMMARY_VALIDATOR.validate(tasksummary)
 
         return tasksummary
 
@@ -978,131 +1193,14 @@ class SparkUIHandler:
         Returns:
             Response: The response object from the task list endpoint.
         """
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "Generated schema for Root",
-            "type": "array",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "taskId": {"type": "number"},
-                    "index": {"type": "number"},
-                    "attempt": {"type": "number"},
-                    "launchTime": {"type": "string"},
-                    "duration": {"type": "number"},
-                    "executorId": {"type": "string"},
-                    "host": {"type": "string"},
-                    "status": {"type": "string"},
-                    "taskLocality": {"type": "string"},
-                    "speculative": {"type": "boolean"},
-                    "accumulatorUpdates": {"type": "array", "items": {}},
-                    "taskMetrics": {
-                        "type": "object",
-                        "properties": {
-                            "executorDeserializeTime": {"type": "number"},
-                            "executorDeserializeCpuTime": {"type": "number"},
-                            "executorRunTime": {"type": "number"},
-                            "executorCpuTime": {"type": "number"},
-                            "resultSize": {"type": "number"},
-                            "jvmGcTime": {"type": "number"},
-                            "resultSerializationTime": {"type": "number"},
-                            "memoryBytesSpilled": {"type": "number"},
-                            "diskBytesSpilled": {"type": "number"},
-                            "peakExecutionMemory": {"type": "number"},
-                            "inputMetrics": {
-                                "type": "object",
-                                "properties": {
-                                    "bytesRead": {"type": "number"},
-                                    "recordsRead": {"type": "number"},
-                                },
-                                "required": ["bytesRead", "recordsRead"],
-                            },
-                            "outputMetrics": {
-                                "type": "object",
-                                "properties": {
-                                    "bytesWritten": {"type": "number"},
-                                    "recordsWritten": {"type": "number"},
-                                },
-                                "required": ["bytesWritten", "recordsWritten"],
-                            },
-                            "shuffleReadMetrics": {
-                                "type": "object",
-                                "properties": {
-                                    "remoteBlocksFetched": {"type": "number"},
-                                    "localBlocksFetched": {"type": "number"},
-                                    "fetchWaitTime": {"type": "number"},
-                                    "remoteBytesRead": {"type": "number"},
-                                    "remoteBytesReadToDisk": {"type": "number"},
-                                    "localBytesRead": {"type": "number"},
-                                    "recordsRead": {"type": "number"},
-                                },
-                                "required": [
-                                    "remoteBlocksFetched",
-                                    "localBlocksFetched",
-                                    "fetchWaitTime",
-                                    "remoteBytesRead",
-                                    "remoteBytesReadToDisk",
-                                    "localBytesRead",
-                                    "recordsRead",
-                                ],
-                            },
-                            "shuffleWriteMetrics": {
-                                "type": "object",
-                                "properties": {
-                                    "bytesWritten": {"type": "number"},
-                                    "writeTime": {"type": "number"},
-                                    "recordsWritten": {"type": "number"},
-                                },
-                                "required": [
-                                    "bytesWritten",
-                                    "writeTime",
-                                    "recordsWritten",
-                                ],
-                            },
-                        },
-                        "required": [
-                            "executorDeserializeTime",
-                            "executorDeserializeCpuTime",
-                            "executorRunTime",
-                            "executorCpuTime",
-                            "resultSize",
-                            "jvmGcTime",
-                            "resultSerializationTime",
-                            "memoryBytesSpilled",
-                            "diskBytesSpilled",
-                            "peakExecutionMemory",
-                            "inputMetrics",
-                            "outputMetrics",
-                            "shuffleReadMetrics",
-                            "shuffleWriteMetrics",
-                        ],
-                    },
-                },
-                "required": [
-                    "taskId",
-                    "index",
-                    "attempt",
-                    "launchTime",
-                    "duration",
-                    "executorId",
-                    "host",
-                    "status",
-                    "taskLocality",
-                    "speculative",
-                    "accumulatorUpdates",
-                ],
-            },
-        }
-
-        endpoint = config.get("spark_ui_api_endpoint_stage_tasklist").format(
+        endpoint = self._endpoint_stage_tasklist(
             app_id=app_id,
             stage_id=stage_id,
             stage_attempt_id=stage_attempt_id,
         )
         tasklist = self.request_wrapper.request("GET", endpoint)
 
-        schema = SchemaValidator(schema)
-        schema.validate(tasklist)
+        _TASK_LIST_VALIDATOR.validate(tasklist)
 
         return tasklist
 
@@ -1197,48 +1295,10 @@ class SparkUIHandler:
         Returns:
             Response: The response object from the environment endpoint.
         """
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "Generated schema for Root",
-            "type": "object",
-            "properties": {
-                "runtime": {
-                    "type": "object",
-                    "properties": {
-                        "javaVersion": {"type": "string"},
-                        "javaHome": {"type": "string"},
-                        "scalaVersion": {"type": "string"},
-                    },
-                    "required": ["javaVersion", "javaHome", "scalaVersion"],
-                },
-                "sparkProperties": {
-                    "type": "array",
-                    "items": {"type": "array", "items": {"type": "string"}},
-                },
-                "systemProperties": {
-                    "type": "array",
-                    "items": {"type": "array", "items": {"type": "string"}},
-                },
-                "classpathEntries": {
-                    "type": "array",
-                    "items": {"type": "array", "items": {"type": "string"}},
-                },
-            },
-            "required": [
-                "runtime",
-                "sparkProperties",
-                "systemProperties",
-                "classpathEntries",
-            ],
-        }
-
-        endpoint = config.get(
-            "spark_ui_api_endpoint_environment",
-        ).format(app_id=app_id)
+        endpoint = self._endpoint_environment(app_id=app_id)
         environment = self.request_wrapper.request("GET", endpoint)
 
-        schema = SchemaValidator(schema)
-        schema.validate(environment)
+        _ENVIRONMENT_VALIDATOR.validate(environment)
 
         return environment
 
@@ -1272,18 +1332,9 @@ class SparkUIHandler:
         Returns:
             dict: A dictionary containing version information.
         """
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "Generated schema for Root",
-            "type": "object",
-            "properties": {"spark": {"type": "string"}},
-            "required": ["spark"],
-        }
-
-        endpoint = config.get("spark_ui_api_endpoint_version")
+        endpoint = self._endpoint_version
         version = self.request_wrapper.request("GET", endpoint)
 
-        schema = SchemaValidator(schema)
-        schema.validate(version)
+        _VERSION_VALIDATOR.validate(version)
 
         return version
@@ -1,273 +1,428 @@
-import glob
-import json
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from time import time
+from typing import NamedTuple
 
+import ijson
+import orjson
 import pandas as pd
 
 from spark_tunning_ml.config import config
 from spark_tunning_ml.data import Data as data
-from spark_tunning_ml.embeddings import Embeddings
 from spark_tunning_ml.logger import logger
-from spark_tunning_ml.milvus import MilvusHandler
 
+PROPERTY_DEFAULT_VALUE_STRING = "N/A"
+PROPERTY_DEFAULT_VALUE_INT = 0
+PROPERTY_DEFAULT_STRING_BYTES = "0b"
+
+# Output columns are fixed by the config: map the dotted names (nested task metrics) to the CSV names once
+RENAME_MAP = {
+    column: column.replace(".", "_")
+    for column in [
+        *config.get("internal_vector_stage_columns"),
+        *[
+            f"{agg_column}_{agg_metric}_agg"
+            for agg_column in config.get("internal_vector_tasks_agg_columns")
+            for agg_metric in config.get("internal_vector_tasks_aggegation_metrics")
+        ],
+    ]
+    if "." in column
+}
+
+
+class AppEnv(NamedTuple):
+    """Application environment properties copied to every stage row of the vector."""
+
+    spark_app_id: str
+    spark_app_name: str
+    spark_tags: str
+    config_file: str
+    spark_queue: str
+    spark_scheduler_minregisteredresourcesratio: object
+    spark_memory_offheap_size: int
+    spark_executor_instances: object
+    spark_executor_cores: object
+    spark_executor_memory: int
+    spark_driver_cores: object
+    spark_driver_memory: int
+    spark_driver_maxresultsize: int
+    spark_default_parallelism: object
+    spark_sql_shuffle_partitions: object
+    spark_shuffle_file_buffer: int
+    spark_dynamic_allocation: int
+    spark_dynamic_allocation_initial: object
+    spark_dynamic_allocation_min: object
+    spark_dynamic_allocation_max: object
+    spark_dynamic_allocation_executors_idle_timeout: object
+    spark_reducer_maxsizeinflight: int
+    spark_sql_autobroadcastjoin: object
+    spark_user_name: str
+
+
+# Vector column of each AppEnv field, in field order
+APP_ENV_COLUMNS = (
+    "sparkAppId",
+    "sparkAppName",
+    "sparkTags",
+    "configFile",
+    "sparkQueue",
+    "sparkSchedulerMinRegisteredResourcesRatio",
+    "sparkMemoryOffHeapSize",
+    "sparkExecutorInstances",
+    "sparkExecutorCores",
+    "sparkExecutorMemory",
+    "sparkDriverCores",
+    "sparkDriverMemory",
+    "sparkDriverMaxResultSize",
+    "sparkDefaultParallelism",
+    "sparkSqlShufflePartitions",
+    "sparkShuffleFileBuffer",
+    "dynamicAllocationEnabled",
+    "dynamicAllocationInitialExecutors",
+    "dynamicAllocationMinExecutors",
+    "dynamicAllocationMaxExecutors",
+    "dynamicAllocationExecutorsIdleTimeout",
+    "reducerMaxSizeInFlight",
+    "sqlAutoBroadcastJoinThreshold",
+    "userName",
+)
+
+
+def _parse_env(spark_properties):
+    """
+    Read the application properties used by the vector from the environment file.
+
+    Parameters:
+    - spark_properties (dict): Spark and system properties of the application.
+
+    Returns:
+    - AppEnv: The properties, with defaults for the missing ones and sizes converted to bytes.
+    """
+
+    def get_bytes(property):
+        return data.convert_to_bytes(spark_properties.get(property, PROPERTY_DEFAULT_STRING_BYTES))
+
+    return AppEnv(
+        spark_app_id=spark_properties.get("spark.app.id", PROPERTY_DEFAULT_VALUE_STRING),
+        spark_app_name=spark_properties.get("spark.app.name", PROPERTY_DEFAULT_VALUE_STRING),
+        spark_tags=spark_properties.get("spark.yarn.tags", PROPERTY_DEFAULT_VALUE_STRING),
+        config_file=spark_properties.get("config.file", PROPERTY_DEFAULT_VALUE_STRING),
+        spark_queue=spark_properties.get("spark.yarn.queue", PROPERTY_DEFAULT_VALUE_STRING),
+        spark_scheduler_minregisteredresourcesratio=spark_properties.get(
+            "spark.scheduler.minRegisteredResourcesRatio", PROPERTY_DEFAULT_VALUE_INT
+        ),
+        spark_memory_offheap_size=get_bytes("spark.memory.offHeap.size"),
+        spark_executor_instances=spark_properties.get("spark.executor.instances", PROPERTY_DEFAULT_VALUE_INT),
+        spark_executor_cores=spark_properties.get("spark.executor.cores", PROPERTY_DEFAULT_VALUE_INT),
+        spark_executor_memory=get_bytes("spark.executor.memory"),
+        spark_driver_cores=spark_properties.get("spark.driver.cores", PROPERTY_DEFAULT_VALUE_INT),
+        spark_driver_memory=get_bytes("spark.driver.memory"),
+        spark_driver_maxresultsize=get_bytes("spark.driver.maxResultSize"),
+        spark_default_parallelism=spark_properties.get("spark.default.parallelism", PROPERTY_DEFAULT_VALUE_INT),
+        spark_sql_shuffle_partitions=spark_properties.get("spark.sql.shuffle.partitions", PROPERTY_DEFAULT_VALUE_INT),
+        spark_shuffle_file_buffer=get_bytes("spark.shuffle.file.buffer"),
+        spark_dynamic_allocation=int(spark_properties.get("spark.dynamicAllocation.enabled", "0") == "true"),
+        spark_dynamic_allocation_initial=spark_properties.get(
+            "spark.dynamicAllocation.initialExecutors", PROPERTY_DEFAULT_VALUE_INT
+        ),
+        spark_dynamic_allocation_min=spark_properties.get(
+            "spark.dynamicAllocation.minExecutors", PROPERTY_DEFAULT_VALUE_INT
+        ),
+        spark_dynamic_allocation_max=spark_properties.get(
+            "spark.dynamicAllocation.maxExecutors", PROPERTY_DEFAULT_VALUE_INT
+        ),
+        spark_dynamic_allocation_executors_idle_timeout=spark_properties.get(
+            "spark.dynamicAllocation.executorIdleTimeout", PROPERTY_DEFAULT_VALUE_INT
+        ),
+        spark_reducer_maxsizeinflight=get_bytes("spark.reducer.maxsizeinflight"),
+        spark_sql_autobroadcastjoin=spark_properties.get(
+            "spark.sql.autoBroadcastJoinThreshold", PROPERTY_DEFAULT_VALUE_INT
+        ),
+        spark_user_name=spark_properties.get("user.name", PROPERTY_DEFAULT_VALUE_STRING),
+    )
+
+
+def _read_stage_json(json_stage, streaming_threshold):
+    """
+    Read a raw stage file written by the Spark UI extraction.
+
+    Files bigger than streaming_threshold bytes are parsed incrementally with ijson and only the first
+    stage attempt (the one build_vector uses) is materialized.
+
+    Parameters:
+    - json_stage (str): Path to the stage JSON file.
+    - streaming_threshold (int): Size in bytes above which the file is streamed.
+
+    Returns:
+    - list: The stage attempts read from the file.
+    """
+    if os.path.getsize(json_stage) > streaming_threshold:
+        with open(json_stage, "rb") as data_stage_file:
+            first_attempt = next(ijson.items(data_stage_file, "item", use_float=True), None)
+        return [first_attempt] if first_attempt is not None else []
+
+    with open(json_stage, "rb") as data_stage_file:
+        return orjson.loads(data_stage_file.read())
+
+
+def _prefetch_stage_json(list_stages_json, streaming_threshold, max_workers):
+    """
+    Read stage files in background threads while the caller processes the previous ones.
+
+    At most max_workers files are read ahead, so memory stays bounded whatever the number of stages.
+
+    Parameters:
+    - list_stages_json (list): Paths of the stage JSON files, in processing order.
+    - streaming_threshold (int): Size in bytes above which stage files are streamed.
+    - max_workers (int): Number of reader threads (and of files read ahead).
+
+    Returns:
+    - generator: (json_stage, future) tuples in the order of list_stages_json; future.result() returns the
+      stage attempts or raises the read error.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending_reads = deque()
+
+        for json_stage in list_stages_json:
+            pending_reads.append((json_stage, executor.submit(_read_stage_json, json_stage, streaming_threshold)))
+            if len(pending_reads) > max_workers:
+                yield pending_reads.popleft()
+
+        while pending_reads:
+            yield pending_reads.popleft()
+
+
+def _process_app(
+    app,
+    data_source_path,
+    path_vector,
+    stage_path,
+    environment_path,
+    stage_columns,
+    named_aggs,
+    stage_streaming_threshold,
+    stage_read_workers,
+):
+    """
+    Build the vector CSV of a single application.
+
+    Runs in a worker process spawned by Vectors.build_vector, so it only depends on its arguments and
+    writes its own {app}.csv under path_vector.
+
+    Parameters:
+    - app (str): Application ID (directory name under data_source_path).
+    - data_source_path (str): Root directory of the extracted applications.
+    - path_vector (str): Output directory for the vector CSV.
+    - stage_path (str): Relative path of the stage files inside the application directory.
+    - environment_path (str): Relative path of the environment files inside the application directory.
+    - stage_columns (list): Stage properties copied to the vector.
+    - named_aggs (dict): Named aggregations ({output column: (task column, function)}) applied to the task
+      metrics, grouped by stage.
+    - stage_streaming_threshold (int): Size in bytes above which stage files are streamed.
+    - stage_read_workers (int): Number of stage files read ahead in background threads.
+
+    Returns:
+    - None
+    """
+    try:
+        app_path = os.path.join(data_source_path, app)
+
+        json_environment = data.list_files_recursive(os.path.join(app_path, environment_path), extension="json")
+        if not json_environment:
+            logger.error(f"Environment file not found for {app}")
+            return
+
+        with open(json_environment[0], "rb") as data_environment_file:
+            json_environment_data = data_environment_file.read()
+
+        json_environment = orjson.loads(json_environment_data)[0]
+
+        if "spark.app.id" not in json_environment or "spark.app.name" not in json_environment:
+            logger.error("id or name not found in environment")
+            return
 
-class Vectors:
-    def __init__(self):
-        """
-        Initializes a new instance of the class.
+        env = _parse_env(json_environment)
+
+        logger.info(f"Processing {env.spark_app_id} - {env.spark_app_name} - {env.spark_tags}")
+
+    except Exception as e:
+        logger.error(f"Error processing environment file {json_environment}: {str(e)}")
+        return
+
+    # Stage rows are accumulated column by column and turned into a single DataFrame after the loop
+    stage_cols = {key: [] for key in [*stage_columns, "numExecutorsAssocStage"]}
+    list_tasks = []
+
+    list_stages_json = data.list_files_recursive(os.path.join(app_path, stage_path), extension="json")
+
+    stage_reads = _prefetch_stage_json(list_stages_json, stage_streaming_threshold, stage_read_workers)
+
+    for count, (json_stage, future_stage) in enumerate(stage_reads):
+        try:
+            json_stage_content = future_stage.result()
 
-        Parameters:
-            self: The object itself.
+            status = json_stage_content[0]["status"]
 
-        Returns:
-            None.
-        """
-        self.milvus = MilvusHandler(
-            uri=os.environ.get("MILVUS_URI"),
-            token=os.environ.get("MILVUS_TOKEN"),
-        )
+            if status != "COMPLETE":
+                logger.warning(f"Removing stage not complete ({status}) for application {env.spark_app_id}")
+                data.delete_file(json_stage)
 
-    def check_property(self, data, property, default_value=None):
-        if property in data:
-            return data[property]
-        else:
-            return default_value
+            if "stageId" not in json_stage_content[0]:
+                break
 
-    def build_vector(self, list_apps=[], data_source_path="data/applications", path_vector="/tmp/vectors"):
-        stage_path = config.get("spark_ui_path_stage_info")
-        environment_path = config.get("spark_ui_path_environment")
+            stage_id = json_stage_content[0]["stageId"]
 
-        PROPERTY_DEFAULT_VALUE_STRING = "N/A"
-        PROPERTY_DEFAULT_VALUE_INT = 0
-        PROPERTY_DEFAULT_STRING_BYTES = "0b"
+            stage_tasks = [
+                pd.json_normalize(value_stage).assign(stageId=stage_id)
+                for value_stage in json_stage_content[0].get("tasks", {}).values()
+            ]
 
-        init_time = time()
+            num_executors = len(json_stage_content[0].get("executorSummary", {}))
 
-        result_apps = []
+            # Everything that can fail is computed above, so a bad stage never leaves the columns ragged
+            for key in stage_columns:
+                stage_cols[key].append(json_stage_content[0].get(key))
+            stage_cols["numExecutorsAssocStage"].append(num_executors)
 
-        try:
-            for app in list_apps:
-                df_stage = pd.DataFrame()
-                df_tasks = pd.DataFrame()
+            list_tasks.extend(stage_tasks)
 
-                try:
-                    result_apps.append(app)
+        except Exception as e:
+            logger.error(f"Error processing file {json_stage}: {str(e)}")
+
+    # Shut the reader threads down now if the loop stopped early
+    stage_reads.close()
+
+    try:
+        # Columns with missing values stay object-typed (as the per-stage frames were) so fillna keeps ints
+        # Environment values are the same for every stage of the application: repeat them once here
+        num_stages = len(stage_cols["numExecutorsAssocStage"])
+        stage_values = {
+            **{key: stage_cols[key] for key in stage_columns},
+            **{column: [value] * num_stages for column, value in zip(APP_ENV_COLUMNS, env)},
+            "numExecutorsAssocStage": stage_cols["numExecutorsAssocStage"],
+        }
+        df_stage = pd.DataFrame(
+            {
+                key: pd.Series(values, dtype=object) if None in values else values
+                for key, values in stage_values.items()
+            },
+            copy=False,
+        )
+        df_tasks = pd.concat(list_tasks)
 
-                    json_environment = data.list_files_recursive(
-                        os.path.join(data_source_path, app, environment_path), extension="json"
-                    )
-                    if not json_environment:
-                        logger.error(f"Environment file not found for {app}")
-                        continue
+        # Categorical keys with observed=True/sort=False group by codes without sorting the stages
+        df_tasks["stageId"] = df_tasks["stageId"].astype("category")
+        df_tasks_agg = df_tasks.groupby("stageId", observed=True, sort=False).agg(**named_aggs)
+        df_tasks_agg.index = df_tasks_agg.index.astype(df_stage["stageId"].dtype)
 
-                    with open(json_environment[0], "r") as data_environment_file:
-                        json_environment_data = data_environment_file.read()
+        df_combined = pd.merge(df_stage, df_tasks_agg, on="stageId", how="inner", validate="one_to_one")
+        df_combined = df_combined.reset_index()
 
-                    json_environment = json.loads(json_environment_data)[0]
+        df_combined["firstTaskLaunchedTime"] = data.convert_dates_to_epoch(df_combined["firstTaskLaunchedTime"])
+        df_combined["completionTime"] = data.convert_dates_to_epoch(df_combined["completionTime"])
 
-                    if "spark.app.id" not in json_environment or "spark.app.name" not in json_environment:
-                        logger.error("id or name not found in environment")
-                        continue
+        df_combined["totalTimeSec"] = (df_combined["completionTime"] - df_combined["firstTaskLaunchedTime"]).abs()
 
-                    spark_properties = json_environment
-                    system_properties = json_environment
+        df_combined.fillna(0, inplace=True)
 
-                    spark_app_id = self.check_property(
-                        spark_properties, "spark.app.id", default_value=PROPERTY_DEFAULT_VALUE_STRING
-                    )
-                    spark_app_name = self.check_property(
-                        spark_properties, "spark.app.name", default_value=PROPERTY_DEFAULT_VALUE_STRING
-                    )
-                    spark_executor_instances = self.check_property(
-                        spark_properties, "spark.executor.instances", default_value=PROPERTY_DEFAULT_VALUE_INT
-                    )
-                    spark_tags = self.check_property(
-                        spark_properties, "spark.yarn.tags", default_value=PROPERTY_DEFAULT_VALUE_STRING
-                    )
-                    config_file = self.check_property(
-                        spark_properties, "config.file", default_value=PROPERTY_DEFAULT_VALUE_STRING
-                    )
-                    spark_queue = self.check_property(
-                        spark_properties, "spark.yarn.queue", default_value=PROPERTY_DEFAULT_VALUE_STRING
-                    )
-                    spark_scheduler_minregisteredresourcesratio = self.check_property(
-                        spark_properties,
-                        "spark.scheduler.minRegisteredResourcesRatio",
-                        default_value=PROPERTY_DEFAULT_VALUE_INT,
-                    )
-                    spark_memory_offheap_size = data.convert_to_bytes(self.check_property(
-                        spark_properties, "spark.memory.offHeap.size", default_value=PROPERTY_DEFAULT_STRING_BYTES
-                    ))
-                    spark_executor_cores = self.check_property(
-                        spark_properties, "spark.executor.cores", default_value=PROPERTY_DEFAULT_VALUE_INT
-                    )
-                    spark_executor_memory = data.convert_to_bytes(self.check_property(
-                        spark_properties, "spark.executor.memory", default_value=PROPERTY_DEFAULT_STRING_BYTES
-                    ))
-                    spark_driver_cores = self.check_property(
-                        spark_properties, "spark.driver.cores", default_value=PROPERTY_DEFAULT_VALUE_INT
-                    )
-                    spark_driver_memory = data.convert_to_bytes(self.check_property(
-                        spark_properties, "spark.driver.memory", default_value=PROPERTY_DEFAULT_STRING_BYTES
-                    ))
-                    spark_driver_maxresultsize = data.convert_to_bytes(self.check_property(
-                        spark_properties, "spark.driver.maxResultSize", default_value=PROPERTY_DEFAULT_STRING_BYTES
-                    ))
-                    spark_default_parallelism = self.check_property(
-                        spark_properties, "spark.default.parallelism", default_value=PROPERTY_DEFAULT_VALUE_INT
-                    )
-                    spark_sql_shuffle_partitions = self.check_property(
-                        spark_properties, "spark.sql.shuffle.partitions", default_value=PROPERTY_DEFAULT_VALUE_INT
-                    )
-                    spark_shuffle_file_buffer = data.convert_to_bytes(self.check_property(
-                        spark_properties, "spark.shuffle.file.buffer", default_value=PROPERTY_DEFAULT_STRING_BYTES
-                    ))
-                    spark_reducer_maxsizeinflight = data.convert_to_bytes(self.check_property(
-                        spark_properties, "spark.reducer.maxsizeinflight", default_value=PROPERTY_DEFAULT_STRING_BYTES
-                    ))
-                    spark_sql_autobroadcastjoin = self.check_property(
-                        spark_properties,
-                        "spark.sql.autoBroadcastJoinThreshold",
-                        default_value=PROPERTY_DEFAULT_VALUE_INT,
-                    )
+        df_combined = df_combined.rename(columns=RENAME_MAP)
 
-                    spark_dynamic_allocation = int(
-                        self.check_property(spark_properties, "spark.dynamicAllocation.enabled", default_value="0")
-                        == "true"
-                    )
-                    spark_dynamic_allocation_initial = self.check_property(
-                        spark_properties,
-                        "spark.dynamicAllocation.initialExecutors",
-                        default_value=PROPERTY_DEFAULT_VALUE_INT,
-                    )
-                    spark_dynamic_allocation_min = self.check_property(
-                        spark_properties,
-                        "spark.dynamicAllocation.minExecutors",
-                        default_value=PROPERTY_DEFAULT_VALUE_INT,
-                    )
-                    spark_dynamic_allocation_max = self.check_property(
-                        spark_properties,
-                        "spark.dynamicAllocation.maxExecutors",
-                        default_value=PROPERTY_DEFAULT_VALUE_INT,
-                    )
-                    spark_dynamic_allocation_executors_idle_timeout = self.check_property(
-                        spark_properties,
-                        "spark.dynamicAllocation.executorIdleTimeout",
-                        default_value=PROPERTY_DEFAULT_VALUE_INT,
-                    )
+        # Round column-wise; only the (few) object columns holding mixed values need a per-cell check
+        float_columns = df_combined.select_dtypes(include="float").columns
+        df_combined[float_columns] = df_combined[float_columns].round(2)
 
-                    spark_user_name = self.check_property(
-                        system_properties, "user.name", default_value=PROPERTY_DEFAULT_VALUE_STRING
-                    )
+        object_columns = df_combined.select_dtypes(include="object").columns
+        df_combined[object_columns] = df_combined[object_columns].map(
+            lambda x: round(x, 2) if isinstance(x, float) else x
+        )
 
-                    logger.info(f"Processing {spark_app_id} - {spark_app_name} - {spark_tags}")
+        path_vector_path_app = os.path.join(path_vector, f"{app}.csv")
+        df_combined.to_csv(path_vector_path_app, index=False)
 
-                except Exception as e:
-                    logger.error(f"Error processing environment file {json_environment}: {str(e)}")
-                    continue
+        logger.info(f"Processed and saved data for {app} to {path_vector_path_app}")
 
-                list_stages_json = data.list_files_recursive(
-                    os.path.join(data_source_path, app, stage_path), extension="json"
-                )
+    except Exception as e:
+        logger.error(f"Error processing aggregation for {app}: {str(e)}")
 
-                for count, json_stage in enumerate(list_stages_json):
-                    try:
-                        with open(json_stage, "r") as data_stage_file:
-                            json_data = data_stage_file.read()
-
-                        json_stage_content = json.loads(json_data)
-
-                        status = json_stage_content[0]["status"]
-
-                        if status != "COMPLETE":
-                            logger.warning(f"Removing stage not complete ({status}) for application {spark_app_id}")
-                            data.delete_file(json_stage)
-
-                        if "stageId" not in json_stage_content[0]:
-                            break
-
-                        stage_id = [json_stage_content[0]["stageId"]]
-
-                        data_stage = {
-                            key: [json_stage_content[0].get(key)] for key in config.get("internal_vector_stage_columns")
-                        }
-                        data_stage["sparkAppId"] = [spark_app_id]
-                        data_stage["sparkAppName"] = [spark_app_name]
-                        data_stage["sparkTags"] = [spark_tags]
-                        data_stage["configFile"] = [config_file]
-                        data_stage["sparkQueue"] = [spark_queue]
-                        data_stage["sparkSchedulerMinRegisteredResourcesRatio"] = [
-                            spark_scheduler_minregisteredresourcesratio
-                        ]
-                        data_stage["sparkMemoryOffHeapSize"] = [spark_memory_offheap_size]
-                        data_stage["sparkExecutorInstances"] = [spark_executor_instances]
-                        data_stage["sparkExecutorCores"] = [spark_executor_cores]
-                        data_stage["sparkExecutorMemory"] = [spark_executor_memory]
-                        data_stage["sparkDriverCores"] = [spark_driver_cores]
-                        data_stage["sparkDriverMemory"] = [spark_driver_memory]
-                        data_stage["sparkDriverMaxResultSize"] = [spark_driver_maxresultsize]
-                        data_stage["sparkDefaultParallelism"] = [spark_default_parallelism]
-                        data_stage["sparkSqlShufflePartitions"] = [spark_sql_shuffle_partitions]
-                        data_stage["sparkShuffleFileBuffer"] = [spark_shuffle_file_buffer]
-                        data_stage["dynamicAllocationEnabled"] = [spark_dynamic_allocation]
-                        data_stage["dynamicAllocationInitialExecutors"] = [spark_dynamic_allocation_initial]
-                        data_stage["dynamicAllocationMinExecutors"] = [spark_dynamic_allocation_min]
-                        data_stage["dynamicAllocationMaxExecutors"] = [spark_dynamic_allocation_max]
-                        data_stage["dynamicAllocationExecutorsIdleTimeout"] = [
-                            spark_dynamic_allocation_executors_idle_timeout
-                        ]
-                        data_stage["reducerMaxSizeInFlight"] = [spark_reducer_maxsizeinflight]
-                        data_stage["sqlAutoBroadcastJoinThreshold"] = [spark_sql_autobroadcastjoin]
-
-                        data_stage["userName"] = [spark_user_name]
-                        data_stage["numExecutorsAssocStage"] = [len(json_stage_content[0].get("executorSummary", {}))]
-
-                        for key, value_stage in json_stage_content[0].get("tasks", {}).items():
-                            json_normalized_stage = pd.json_normalize(value_stage).assign(stageId=stage_id)
-                            df_tasks = pd.concat([df_tasks, json_normalized_stage])
-
-                        df_stage = pd.concat([df_stage, pd.DataFrame(data_stage)])
 
-                    except Exception as e:
-                        logger.error(f"Error processing file {json_stage}: {str(e)}")
+class Vectors:
+    def __init__(self):
+        """
+        Initializes a new instance of the class.
 
-                try:
-                    agg_dict = {
-                        key: config.get("internal_vector_tasks_aggegation_metrics")
-                        for key in config.get("internal_vector_tasks_agg_columns")
-                    }
-                    df_tasks_agg = df_tasks.groupby(["stageId"]).agg(agg_dict)
-                    df_tasks_agg.columns = [f"{col[0]}_{col[1]}_agg" for col in df_tasks_agg.columns]
+        Parameters:
+            self: The object itself.
 
-                    df_combined = pd.merge(df_stage, df_tasks_agg, on="stageId", how="inner", validate="one_to_one")
-                    df_combined = df_combined.reset_index()
+        Returns:
+            None.
+        """
+        # Created on first use: building vectors does not need Milvus (nor its client library)
+        self.milvus = None
 
-                    df_combined["firstTaskLaunchedTime"] = df_combined["firstTaskLaunchedTime"].apply(
-                        lambda x: data.convert_date_to_epoch(str(x))
-                    )
-                    df_combined["completionTime"] = df_combined["completionTime"].apply(
-                        lambda x: data.convert_date_to_epoch(str(x))
-                    )
+    def _get_milvus(self):
+        """
+        Return the Milvus handler, creating it on first use.
 
-                    df_combined["totalTimeSec"] = df_combined.apply(
-                        lambda row: abs(row["completionTime"] - row["firstTaskLaunchedTime"]), axis=1
-                    )
+        Returns:
+            MilvusHandler: The handler connected to MILVUS_URI with MILVUS_TOKEN.
+        """
+        if self.milvus is None:
+            from spark_tunning_ml.milvus import MilvusHandler
 
-                    df_combined.fillna(0, inplace=True)
+            self.milvus = MilvusHandler(
+                uri=os.environ.get("MILVUS_URI"),
+                token=os.environ.get("MILVUS_TOKEN"),
+            )
 
-                    df_combined = df_combined.rename(columns=lambda x: x.replace(".", "_"))
+        return self.milvus
 
-                    df_combined = df_combined.map(lambda x: round(x, 2) if isinstance(x, float) else x)
+    def build_vector(
+        self, list_apps=[], data_source_path="data/applications", path_vector="/tmp/vectors", max_workers=None
+    ):
+        stage_path = config.get("spark_ui_path_stage_info")
+        environment_path = config.get("spark_ui_path_environment")
+        stage_columns = config.get("internal_vector_stage_columns")
+        agg_metrics = config.get("internal_vector_tasks_aggegation_metrics")
+        agg_columns = config.get("internal_vector_tasks_agg_columns")
+        stage_streaming_threshold = config.get("internal_vector_stage_streaming_threshold_bytes")
+        stage_read_workers = config.get("internal_vector_stage_read_workers")
+
+        named_aggs = {
+            f"{agg_column}_{agg_metric}_agg": (agg_column, agg_metric)
+            for agg_column in agg_columns
+            for agg_metric in agg_metrics
+        }
 
-                    path_vector_path_app = os.path.join(path_vector, f"{app}.csv")
-                    df_combined.to_csv(path_vector_path_app, index=False)
+        init_time = time()
 
-                    logger.info(f"Processed and saved data for {app} to {path_vector_path_app}")
+        result_apps = []
+
+        try:
+            # Each application is independent (own input files, own output CSV): process them in parallel
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures_apps = [
+                    executor.submit(
+                        _process_app,
+                        app,
+                        data_source_path,
+                        path_vector,
+                        stage_path,
+                        environment_path,
+                        stage_columns,
+                        named_aggs,
+                        stage_streaming_threshold,
+                        stage_read_workers,
+                    )
+                    for app in list_apps
+                ]
 
-                except Exception as e:
-                    logger.error(f"Error processing aggregation file {json_stage}: {str(e)}")
-                    continue
+                for app, future_app in zip(list_apps, futures_apps):
+                    result_apps.append(app)
+                    try:
+                        future_app.result()
+                    except Exception as e:
+                        logger.error(f"Error processing application {app}: {str(e)}")
 
         except Exception as e:
             logger.error(f"General error in build_vector: {str(e)}")
@@ -287,20 +442,21 @@ class Vectors:
         spark_fields = config.get("internal_milvus_fields_spark_metrics")
         milvus_force_rebuild_schema = config.get("internal_milvus_force_rebuild_schema")
 
-        OUTPUT_FILE = "merge_application"
+        from spark_tunning_ml.embeddings import Embeddings
 
-        self.milvus.connect()
+        milvus = self._get_milvus()
+        milvus.connect()
 
-        logger.info(f"Collections{str(self.milvus.list_collections())}")
+        logger.info(f"Collections{str(milvus.list_collections())}")
 
         if milvus_force_rebuild_schema:
-            if self.milvus.has_collection(spark_collection):
-                self.milvus.drop_collection(spark_collection)
-            self.milvus.create_collection(spark_collection, spark_fields)
+            if milvus.has_collection(spark_collection):
+                milvus.drop_collection(spark_collection)
+            milvus.create_collection(spark_collection, spark_fields)
         else:
-            self.milvus.get_collection(spark_collection)
+            milvus.get_collection(spark_collection)
 
-        all_files = glob.glob(os.path.join(path_files, "*.csv"))
+        all_files = [entry.path for entry in os.scandir(path_files) if entry.name.endswith(".csv")]
 
         embedding_instance = Embeddings(model_name=config.get("internal_milvus_model_embeddins"))
 
@@ -308,20 +464,20 @@ class Vectors:
         list_field_schema = [item for item in spark_fields if item not in exclude_own_langchain]
 
         bulk_num_files = config.get("internal_milvuls_bulk_num_csv")
+        insert_chunk_size = config.get("internal_milvus_insert_chunk_size")
 
         for i in range(0, len(all_files), bulk_num_files):
             batch = all_files[i : i + bulk_num_files]
 
-            random_string = data.generate_random_string(4)
+            df_batch = self.read_and_concatenate_batch(batch)
 
-            num_rows = self.read_and_concatenate_batch(batch, f"{path_files}/{OUTPUT_FILE}_{random_string}.csv")
+            logger.info(f"Inserting {len(df_batch)} rows")
 
-            data_vector = embedding_instance.build_entities(
-                f"{path_files}/{OUTPUT_FILE}_{random_string}.csv", list_field_schema
-            )
+            # Embed and insert chunk by chunk so only one chunk of vectors is held in memory at a time
+            for data_vector in embedding_instance.build_entities_chunks(df_batch, list_field_schema, insert_chunk_size):
+                milvus.insert_data(data_vector, flush=False)
 
-            logger.info(f"Inserting {num_rows} rows")
-            self.milvus.insert_data(data_vector)
+            milvus.flush()
 
         if milvus_force_rebuild_schema:
             index_params = {
@@ -329,36 +485,34 @@ class Vectors:
                 "index_type": "IVF_FLAT",
                 "params": {"nlist": 1024},
             }
-            self.milvus.create_index(field_name="vector", index_params=index_params)
+            milvus.create_index(field_name="vector", index_params=index_params)
 
-        logger.info(f"Number of entities in {spark_collection}: {self.milvus.get_entity_num()}")
+        logger.info(f"Number of entities in {spark_collection}: {milvus.get_entity_num()}")
 
         logger.info("Loading collection...")
-        self.milvus.load_collection()
+        milvus.load_collection()
 
         logger.info("End process")
 
-    def read_and_concatenate_batch(self, batch, path_csv):
+    def read_and_concatenate_batch(self, batch):
         # Read and concatenate data from CSV files in the batch
-        batch_dataframes = [pd.read_csv(file_path) for file_path in batch]
-        concatenated_data = pd.concat(batch_dataframes, ignore_index=True)
-        concatenated_data.to_csv(path_csv, index=False)
-        return len(concatenated_data)
+        return pd.concat([pd.read_csv(file_path) for file_path in batch], ignore_index=True)
 
     def milvus_load_collection(self):
-        self.milvus.connect()
+        milvus = self._get_milvus()
+        milvus.connect()
 
         process_name = config.get("internal_process_name")
         spark_collection = data.convert_to_camel_case(
             f"{config.get('internal_milvus_collection_spark_metrics')}-{process_name}"
         )
 
-        self.milvus.get_collection(spark_collection)
+        milvus.get_collection(spark_collection)
 
         logger.info(f"Loading collection {spark_collection}")
 
-        self.milvus.load_collection()
+        milvus.load_collection()
 
-        logger.info(f"Number of entities in collection: {self.milvus.get_entity_num()}")
+        logger.info(f"Number of entities in collection: {milvus.get_entity_num()}")
 
         logger.info("End process")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import sys
 
 import pytest
@@ -15,3 +16,24 @@ def go_to_tmpdir(request):
     # Chdir only for the duration of the test.
     with tmpdir.as_cwd():
         yield
+
+
+@pytest.fixture(scope="session")
+def data_instance():
+    # Imported here so that collecting modules that don't use it does not load pandas
+    from spark_tunning_ml.data import Data
+
+    # Data only exposes static helpers, so one instance serves every test
+    return Data()
+
+
+@pytest.fixture(scope="session")
+def shared_parquet_bytes():
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # Encode the dummy data to Parquet once per session (once per worker under xdist)
+    data = {"col1": [1, 2, 3], "col2": ["a", "b", "c"]}
+    buffer = io.BytesIO()
+    pq.write_table(pa.table(data), buffer)
+    return buffer.getvalue()
@@ -8,39 +8,57 @@ import pytest
 
 from spark_tunning_ml.config import Config
 
-OPEN_FUNCTION = "builtins.open"
+# Only the config module sees the mocked open, so the patch can stay active for the whole module
+OPEN_FUNCTION = "spark_tunning_ml.config.open"
 CONFIG_FILE = "config.json"
+CONFIG_DATA = {"property1": "value1", "property2": 42, "property3": True}
+CONFIG_JSON = json.dumps(CONFIG_DATA).encode()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config_data():
-    return {"property1": "value1", "property2": 42, "property3": True}
+    return CONFIG_DATA
 
 
-def test_config_loads_properties(config_data):
-    # Mock the built-in open function and return a file with the specified content
-    with patch(OPEN_FUNCTION, mock_open(read_data=json.dumps(config_data))) as mock_file:
-        # Replace with the actual path to your config file
-        config = Config(CONFIG_FILE)
+@pytest.fixture(scope="module", autouse=True)
+def open_mock():
+    # Mock the open function and return a file with the specified content, built once per module
+    with patch(OPEN_FUNCTION, mock_open(read_data=CONFIG_JSON), create=True) as mock_file:
+        yield mock_file
 
-        # Verify that the file was opened with the correct path
-        mock_file.assert_called_once_with(CONFIG_FILE, "r")
 
-        # Verify that the config object contains the correct properties
-        assert config.get_all_properties() == config_data
+@pytest.fixture(autouse=True)
+def reset_open_mock(open_mock):
+    yield
+    open_mock.reset_mock()
 
 
-def test_config_get_prop(config_data):
-    with patch(OPEN_FUNCTION, mock_open(read_data=json.dumps(config_data))):
-        config = Config(CONFIG_FILE)
+@pytest.fixture(scope="module")
+def config(open_mock):
+    # Parsed once per module
+    return Config(CONFIG_FILE)
 
-        # Test getting a specific property
-        assert config.get("property1") == "value1"
-        assert config.get("property2") == 42
 
-        # Test getting a non-existent property
-        with pytest.raises(KeyError):
-            config.get("non_existent_property")
+def test_config_loads_properties(open_mock, config_data):
+    config = Config(CONFIG_FILE)
+
+    # Verify that the file was opened with the correct path
+    open_mock.assert_called_once_with(CONFIG_FILE, "rb")
+
+    # Verify that the config object contains the correct properties
+    assert config.get_all_properties() == config_data
+
+
+@pytest.mark.parametrize("key, expected", [("property1", "value1"), ("property2", 42), ("property3", True)])
+def test_config_get_prop(config, key, expected):
+    # Test getting a specific property
+    assert config.get(key) == expected
+
+
+def test_config_get_missing_prop(config):
+    # Test getting a non-existent property
+    with pytest.raises(KeyError):
+        config.get("non_existent_property")
 
 
 def test_config_file_not_found():
@@ -53,5 +71,5 @@ def test_config_file_not_found():
 def test_config_invalid_json():
     # Test when the file contains invalid JSON
     with pytest.raises(ValueError):
-        with patch(OPEN_FUNCTION, mock_open(read_data="invalid_json")):
+        with patch(OPEN_FUNCTION, mock_open(read_data=b"invalid_json")):
             Config(CONFIG_FILE)
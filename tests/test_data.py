@@ -2,25 +2,18 @@ from __future__ import annotations
 
 import json
 import os
+from unittest.mock import call
+from unittest.mock import patch
 
-import pandas as pd
 import pytest
 
-from spark_tunning_ml.data import Data
-
-CSV_TEST = "test.csv"
 JSON_TEST = "test.json"
 
 
-@pytest.fixture
-def data_instance():
-    return Data()
-
-
-def test_list_to_json_with_valid_data(data_instance):
+def test_list_to_json_with_valid_data(data_instance, tmp_path):
     # Arrange
     data_list = [1, 2, 3]
-    json_file = JSON_TEST
+    json_file = tmp_path / JSON_TEST
 
     # Act
     data_instance.list_to_json(data_list, json_file)
@@ -31,75 +24,73 @@ def test_list_to_json_with_valid_data(data_instance):
     assert result == data_list
 
 
-def test_list_to_json_with_empty_list(data_instance):
-    # Arrange
-    data_list = []
-    json_file = JSON_TEST
-
-    # Act and Assert
-    with pytest.raises(ValueError):
-        data_instance.list_to_json(data_list, json_file)
-
-
-def test_list_to_json_with_invalid_data(data_instance):
-    # Arrange
-    data_list = "not a list"
-    json_file = JSON_TEST
+@pytest.mark.parametrize("data_list, expected_exception", [([], ValueError), ("not a list", TypeError)])
+def test_list_to_json_with_invalid_input(data_instance, tmp_path, data_list, expected_exception):
+    json_file = tmp_path / JSON_TEST
 
-    # Act and Assert
-    with pytest.raises(TypeError):
+    with pytest.raises(expected_exception):
         data_instance.list_to_json(data_list, json_file)
 
 
 def test_create_folders_valid_input(data_instance):
     folder_paths = ["path1", "path2", "path3"]
-    assert data_instance.create_folders(folder_paths) is None
-    # Add assertions to check if the folders are created as expected
-
+    with patch("spark_tunning_ml.data.os.makedirs") as mock_makedirs:
+        assert data_instance.create_folders(folder_paths) is None
 
-def test_create_folders_empty_list(data_instance):
-    folder_paths = []
-    with pytest.raises(ValueError):
-        data_instance.create_folders(folder_paths)
+    # Check that every folder is created, tolerating existing ones
+    assert mock_makedirs.call_args_list == [call(folder_path, exist_ok=True) for folder_path in folder_paths]
 
 
-def test_create_folders_invalid_input(data_instance):
-    folder_paths = "path"
-    with pytest.raises(TypeError):
+@pytest.mark.parametrize("folder_paths, expected_exception", [([], ValueError), ("path", TypeError)])
+def test_create_folders_with_invalid_input(data_instance, folder_paths, expected_exception):
+    with pytest.raises(expected_exception):
         data_instance.create_folders(folder_paths)
 
 
 # Test case 2: Test when the input directory does not exist
-def test_compact_parquet_files_with_nonexistent_directory(data_instance):
+def test_compact_parquet_files_with_nonexistent_directory(data_instance, tmp_path):
     input_directory = "/path/to/nonexistent_directory"
-    output_file = "/tmp/output_file.parquet"
+    output_file = tmp_path / "output_file.parquet"
 
     # Call the function and assert that it raises a FileNotFoundError
     with pytest.raises(FileNotFoundError):
         data_instance.compact_parquet_files(input_directory, output_file)
 
 
-# Utility function to create dummy Parquet files in a directory
-def create_dummy_parquet_files(directory):
-    # Create some dummy data
-    data = {"col1": [1, 2, 3], "col2": ["a", "b", "c"]}
-    df = pd.DataFrame(data)
-
-    # Save the data as Parquet files in the directory
+@pytest.fixture
+def dummy_parquet_files(tmp_path, shared_parquet_bytes):
+    # Create dummy Parquet files in a directory by copying the encoded bytes
+    directory = tmp_path / "parquet"
+    directory.mkdir()
     for i in range(3):
-        file_path = os.path.join(directory, f"file_{i}.parquet")
-        df.to_parquet(file_path, index=False)
+        (directory / f"file_{i}.parquet").write_bytes(shared_parquet_bytes)
+    return directory
 
 
 # Utility function to check if a file is a valid Parquet file
 def is_valid_parquet_file(file_path):
+    from pyarrow.parquet import ParquetFile
+
+    # Only the footer (metadata) is parsed, the column data is not decoded
     try:
-        pd.read_parquet(file_path)
+        ParquetFile(str(file_path)).metadata
         return True
-    except:
+    except Exception:
         return False
 
 
+def test_compact_parquet_files(dummy_parquet_files, data_instance, tmp_path):
+    from pyarrow.parquet import ParquetFile
+
+    output_file = tmp_path / "output_file.parquet"
+
+    data_instance.compact_parquet_files(str(dummy_parquet_files), str(output_file))
+
+    assert is_valid_parquet_file(output_file)
+    # The row count is read from the footer, no need to decode the data
+    assert ParquetFile(str(output_file)).metadata.num_rows == 9
+
+
 @pytest.fixture
 def sample_files(tmp_path):
     # Create sample Parquet files in a temporary directory
@@ -109,8 +100,7 @@ def sample_files(tmp_path):
         tmp_path / "other_file.txt",  # This file should not be deleted
     ]
     for file_path in file_paths:
-        with open(file_path, "w") as f:
-            f.write("Sample data")
+        file_path.write_bytes(b"Sample data")
     return tmp_path
 
 
@@ -126,8 +116,8 @@ def test_delete_files(sample_files, data_instance):
     assert deleted_count == 2
 
     # Check if only files were deleted
-    remaining_files = os.listdir(directory)
-    assert all(file.endswith(".parquet") is False for file in remaining_files)
+    with os.scandir(directory) as remaining_files:
+        assert all(not file.name.endswith(".parquet") for file in remaining_files)
 
 
 def test_remove_directory(tmpdir, data_instance):
@@ -168,30 +158,25 @@ def test_directory(tmp_path):
 
     # Create some files and subdirectories
     file_names = ["file1.txt", "file2.txt", "file3.md", "subdir/file4.txt"]
+    for parent in {(dir_path / file_name).parent for file_name in file_names}:
+        parent.mkdir(parents=True, exist_ok=True)
     for file_name in file_names:
-        file_path = dir_path / file_name
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
+        (dir_path / file_name).touch()
 
     return str(dir_path)
 
 
-def test_count_files_all_files(test_directory, data_instance):
-    total_files = data_instance.count_files(test_directory)
-    assert total_files == 4  # 4 files were created in the test directory
-
-
-def test_count_files_filtered_by_extension(test_directory, data_instance):
-    total_files_txt = data_instance.count_files(test_directory, extension="txt")
-    assert total_files_txt == 3  # 3 txt files were created in the test directory
-
-    total_files_md = data_instance.count_files(test_directory, extension="md")
-    assert total_files_md == 1  # 1 md file was created in the test directory
-
-
-def test_count_files_nonexistent_extension(test_directory, data_instance):
-    total_files = data_instance.count_files(test_directory, extension="png")
-    assert total_files == 0
+@pytest.mark.parametrize(
+    "extension, expected",
+    [
+        (None, 4),  # 4 files were created in the test directory
+        ("txt", 3),  # 3 txt files were created in the test directory
+        ("md", 1),  # 1 md file was created in the test directory
+        ("png", 0),
+    ],
+)
+def test_count_files(test_directory, data_instance, extension, expected):
+    assert data_instance.count_files(test_directory, extension=extension) == expected
 
 
 def test_list_files_recursive(data_instance):
@@ -245,3 +230,22 @@ def test_generate_random_directory(base_path, data_instance):
     for directory in result_directories:
         assert os.path.exists(directory)
         assert os.path.isdir(directory)
+
+
+def test_convert_dates_to_epoch(data_instance):
+    import pandas as pd
+
+    dates = ["2023-12-01T10:15:30.123GMT", "2023-12-01T10:16:02.999GMT", "1970-01-01T00:00:01.000GMT"]
+
+    result = data_instance.convert_dates_to_epoch(pd.Series(dates))
+
+    assert result.tolist() == [data_instance.convert_date_to_epoch(date) for date in dates]
+
+
+def test_convert_to_bytes(data_instance):
+    assert data_instance.convert_to_bytes("0b") == 0
+    assert data_instance.convert_to_bytes("32k") == 32 * 1024
+    assert data_instance.convert_to_bytes("4g") == 4 * 1024**3
+
+    with pytest.raises(ValueError):
+        data_instance.convert_to_bytes("4x")
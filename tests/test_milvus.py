@@ -1,20 +1,41 @@
-import pytest
 from unittest.mock import patch
+
+import pytest
 from pymilvus import MilvusException
+
 from spark_tunning_ml.milvus import MilvusHandler
 
+MILVUS_URI = "http://localhost:19530"
+MILVUS_TOKEN = "token"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_connections():
+    # No test in this module may reach a real Milvus server
+    with patch("spark_tunning_ml.milvus.connections") as mock_connections:
+        yield mock_connections
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_connections(mock_connections):
+    yield
+    mock_connections.reset_mock(side_effect=True)
+
 
 class TestConnect:
-    def setup_method(self, method):
-        self.your_instance = MilvusHandler()
-
-    @patch("pymilvus.connections.connect")
-    def test_successful_connection(self, mock_connect):
-        self.your_instance.connect()
-        mock_connect.assert_called_once_with(host=self.your_instance.host, port=self.your_instance.port)
-
-    @patch("pymilvus.connections.connect", side_effect=MilvusException("Error"))
-    def test_failed_connection(self, mock_connect, capsys):
-        self.your_instance.connect()
-        captured = capsys.readouterr()
-        assert captured.out == f"Failed to connect to Milvus: Error\n"
+    @pytest.fixture(scope="class")
+    def milvus_handler(self):
+        return MilvusHandler(uri=MILVUS_URI, token=MILVUS_TOKEN)
+
+    def test_successful_connection(self, milvus_handler, mock_connections):
+        milvus_handler.connect()
+        mock_connections.connect.assert_called_once_with(alias="default", uri=MILVUS_URI, token=MILVUS_TOKEN)
+
+    def test_failed_connection(self, milvus_handler, mock_connections):
+        mock_connections.connect.side_effect = MilvusException(message="Error")
+
+        with patch("spark_tunning_ml.milvus.logger") as mock_logger:
+            milvus_handler.connect()
+
+        mock_logger.error.assert_called_once()
+        assert mock_logger.error.call_args.args[0].startswith("Failed to connect to Milvus:")
@@ -1,57 +1,86 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import patch
 
+import orjson
 import pytest
-import requests
 
+from spark_tunning_ml.config import config
 from spark_tunning_ml.request_handler import (
     RequestHandler,
 )
 
+BASE_URL = "https://api.example.com"
+EXPECTED_JSON = {"key": "value"}
 
-@pytest.fixture
+
+def build_response(json_data):
+    # Plain namespace with just what RequestHandler reads: no call recording, no auto-created attributes
+    return SimpleNamespace(status_code=200, content=orjson.dumps(json_data), raise_for_status=lambda: None)
+
+
+# Mocked response shared by the GET and POST tests
+MOCK_RESPONSE = build_response(EXPECTED_JSON)
+
+
+@pytest.fixture(scope="session")
 def request_wrapper():
-    return RequestHandler("https://api.example.com")
+    return RequestHandler(BASE_URL)
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_get_request(mock_get, request_wrapper):
     # Mocking the response for the GET request
     endpoint = "get_endpoint"
-    expected_url = f"https://api.example.com{endpoint}"
-    expected_response_json = {"key": "value"}
-    mock_response = requests.Response()
-    mock_response.status_code = 200
-    mock_response.json = lambda: expected_response_json
-    mock_get.return_value = mock_response
+    expected_url = f"{BASE_URL}{endpoint}"
+    mock_get.return_value = MOCK_RESPONSE
 
     # Making the actual GET request
     response_json = request_wrapper.request("GET", endpoint)
 
     mock_get.assert_called_once_with(expected_url, params=None)
-    assert response_json == expected_response_json
+    assert response_json == EXPECTED_JSON
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_post_request(mock_post, request_wrapper):
     # Mocking the response for the POST request
     endpoint = "post_endpoint"
-    expected_url = f"https://api.example.com{endpoint}"
-    expected_response_json = {"key": "value"}
-    mock_response = requests.Response()
-    mock_response.status_code = 200
-    mock_response.json = lambda: expected_response_json
-    mock_post.return_value = mock_response
+    expected_url = f"{BASE_URL}{endpoint}"
+    mock_post.return_value = MOCK_RESPONSE
 
     # Making the actual POST request
     response_json = request_wrapper.request("POST", endpoint)
 
     mock_post.assert_called_once_with(expected_url, data=None, json=None)
-    assert response_json == expected_response_json
+    assert response_json == EXPECTED_JSON
 
 
 def test_invalid_method(request_wrapper):
     # Testing invalid HTTP method
     with pytest.raises(ValueError, match="Unsupported HTTP method. Supported methods: 'GET', 'POST'."):
         request_wrapper.request("INVALID_METHOD", "some_endpoint")
+
+
+@patch("requests.Session.get")
+def test_request_many(mock_get, request_wrapper):
+    endpoints = [f"/stages/{stage_id}" for stage_id in range(5)]
+
+    mock_get.side_effect = lambda url, params=None: build_response({"url": url})
+
+    responses = request_wrapper.request_many("GET", endpoints, max_workers=3)
+
+    # Responses keep the order of the endpoints, whatever order the requests complete in
+    assert responses == [{"url": f"{BASE_URL}{endpoint}"} for endpoint in endpoints]
+    assert mock_get.call_count == len(endpoints)
+
+
+def test_session_retries_transient_errors(request_wrapper):
+    retry = request_wrapper.session.get_adapter(BASE_URL).max_retries
+
+    assert retry.total == config.get("internal_spark_ui_request_retries")
+    assert {429, 503} <= set(retry.status_forcelist)
+    assert retry.respect_retry_after_header
+    # POST is not idempotent, so it is never retried
+    assert retry.is_retry("POST", 503) is False
@@ -3,7 +3,7 @@ from __future__ import annotations
 import jsonschema
 import pytest
 
-from spark_tunning_ml.schema import SchemaValidator
+from spark_tunning_ml.schema import SchemaValidator, get_validator
 
 # Example schema for testing
 example_schema = {
@@ -16,7 +16,8 @@ example_schema = {
 }
 
 
-@pytest.fixture
+# The validator is stateless: build (and compile) it once for the whole session
+@pytest.fixture(scope="session")
 def my_schema():
     return SchemaValidator(example_schema)
 
@@ -38,6 +39,18 @@ def test_validate_failure(my_schema):
         my_schema.validate(invalid_data)
 
 
+@pytest.mark.parametrize(
+    "schema, instance",
+    [
+        ({"type": "string", "format": "email"}, "x"),
+        ({"type": "string", "pattern": "^a$"}, "a\n"),
+    ],
+)
+def test_validate_jsonschema_is_authoritative(schema, instance):
+    # fastjsonschema rejects these, but Draft7 (which decides) accepts them
+    SchemaValidator(schema).validate(instance)
+
+
 def test_iter_errors(my_schema):
     # Example JSON data that does not conform to the schema
     invalid_data = {"name": "John Doe"}  # Missing "age" field
@@ -45,8 +58,15 @@ def test_iter_errors(my_schema):
     # Getting an iterator of validation errors
     errors_iterator = my_schema.iter_errors(invalid_data)
 
-    # At least one error should be present in the iterator
-    assert any(errors_iterator)
+    # At least one error should be present in the iterator (stop at the first one)
+    assert next(errors_iterator, None) is not None
+
+
+def test_get_validator_is_shared():
+    # Equal schemas share one validator, whatever their key order
+    reordered_schema = dict(reversed(list(example_schema.items())))
+
+    assert get_validator(reordered_schema) is get_validator(example_schema)
 
 
 def test_validate_with_schema_error():
@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-from unittest.mock import patch
-
 import jsonschema
 import pytest
 
@@ -10,310 +7,153 @@ from spark_tunning_ml.spark_ui_handler import (
     SparkUIHandler,
 )
 
+APPLICATIONS_URL = "https://api.example.com/applications?status=completed&limit=10000"
+
+
+def build_attempt(start_time, start_time_epoch, completed=True, attempt_id=None):
+    attempt = {
+        "startTime": start_time,
+        "endTime": "1969-12-31T23:59:59.999GMT",
+        "lastUpdated": start_time,
+        "duration": 0,
+        "sparkUser": "root",
+        "completed": completed,
+        "appSparkVersion": "2.4.1",
+        "startTimeEpoch": start_time_epoch,
+        "endTimeEpoch": -1,
+        "lastUpdatedEpoch": start_time_epoch,
+    }
+    if attempt_id is not None:
+        attempt["attemptId"] = attempt_id  # Optional field
+    return attempt
+
+
+def build_application(app_id, attempts):
+    return {"id": app_id, "name": "Python Spark SQL data source example", "attempts": attempts}
+
+
+# Built once at import and shared by every test case; no test mutates them
+FIRST_ATTEMPT = ("2023-12-04T14:29:14.422GMT", 1701700154422)
+SECOND_ATTEMPT = ("2023-12-04T14:30:00.000GMT", 1701700200000)
+THIRD_ATTEMPT = ("2023-12-04T14:30:30.000GMT", 1701700230000)
+
+RUNNING_APP = build_application(
+    "app-20231204142916-0004",
+    [build_attempt(*FIRST_ATTEMPT, completed=False, attempt_id="1")],
+)
+RUNNING_APP_WITHOUT_ATTEMPT_ID = build_application(
+    "app-20231204142916-0004",
+    [build_attempt(*FIRST_ATTEMPT, completed=False)],
+)
+COMPLETED_APP = build_application(
+    "app-20231204142916-0004",
+    [build_attempt(*FIRST_ATTEMPT, attempt_id="1")],
+)
+RETRIED_APP = build_application(
+    "app-20231204142916-0005",
+    [build_attempt(*SECOND_ATTEMPT, attempt_id="2"), build_attempt(*THIRD_ATTEMPT, attempt_id="1")],
+)
+RETRIED_APP_WITHOUT_LAST_ATTEMPT_ID = build_application(
+    "app-20231204142916-0005",
+    [build_attempt(*SECOND_ATTEMPT, attempt_id="2"), build_attempt(*THIRD_ATTEMPT)],
+)
+RETRIED_TWICE_APP = build_application(
+    "app-20231204142916-0005",
+    [
+        build_attempt(*SECOND_ATTEMPT, attempt_id="1"),
+        build_attempt(*THIRD_ATTEMPT, attempt_id="2"),
+        build_attempt(*THIRD_ATTEMPT, attempt_id="3"),
+    ],
+)
+
+APPLICATIONS = [RUNNING_APP, RETRIED_APP]
+
 
-@pytest.fixture
+# The handler (session, connection pool) is not mutated by any test, so it is built once per module
+@pytest.fixture(scope="module")
 def spark_ui_wrapper():
     return SparkUIHandler("https://api.example.com")
 
 
-@patch("requests.get")
-def test_successful_get_applications(mock_get, spark_ui_wrapper):
-    # Mocking the response for the GET request
-    endpoint = "/applications?status=running&limit=10000"
-    expected_url = f"https://api.example.com{endpoint}"
-    expected_response_json = [
-        {
-            "id": "app-20231204142916-0004",
-            "name": "Python Spark SQL data source example",
-            "attempts": [
-                {
-                    "startTime": "2023-12-04T14:29:14.422GMT",
-                    "endTime": "1969-12-31T23:59:59.999GMT",
-                    "lastUpdated": "2023-12-04T14:29:14.422GMT",
-                    "duration": 0,
-                    "sparkUser": "root",
-                    "completed": False,
-                    "appSparkVersion": "2.4.1",
-                    "startTimeEpoch": 1701700154422,
-                    "endTimeEpoch": -1,
-                    "lastUpdatedEpoch": 1701700154422,
-                    "attemptId": "1",  # Optional field
-                },
-            ],
-        },
-        {
-            "id": "app-20231204142916-0005",
-            "name": "Python Spark SQL data source example",
-            "attempts": [
-                {
-                    "startTime": "2023-12-04T14:30:00.000GMT",
-                    "endTime": "1969-12-31T23:59:59.999GMT",
-                    "lastUpdated": "2023-12-04T14:30:00.000GMT",
-                    "duration": 0,
-                    "sparkUser": "root",
-                    "completed": True,
-                    "appSparkVersion": "2.4.1",
-                    "startTimeEpoch": 1701700200000,
-                    "endTimeEpoch": -1,
-                    "lastUpdatedEpoch": 1701700200000,
-                    "attemptId": "2",  # Optional field
-                },
-                {
-                    "startTime": "2023-12-04T14:30:30.000GMT",
-                    "endTime": "1969-12-31T23:59:59.999GMT",
-                    "lastUpdated": "2023-12-04T14:30:30.000GMT",
-                    "duration": 0,
-                    "sparkUser": "root",
-                    "completed": True,
-                    "appSparkVersion": "2.4.1",
-                    "startTimeEpoch": 1701700230000,
-                    "endTimeEpoch": -1,
-                    "lastUpdatedEpoch": 1701700230000,
-                    "attemptId": "1",  # Optional field
-                },
-            ],
-        },
-    ]
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = expected_response_json
-    mock_get.return_value = mock_response
+def test_successful_get_applications(requests_mock, spark_ui_wrapper):
+    # The response is served by the requests_mock transport adapter
+    requests_mock.get(APPLICATIONS_URL, json=APPLICATIONS)
 
     # Making the actual GET request
     response = spark_ui_wrapper.get_applications(apps_limit=10000)
 
-    mock_get.assert_called_once_with(expected_url, params=None)
-    assert response == expected_response_json
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.url == APPLICATIONS_URL
+    assert response == APPLICATIONS
 
 
-@patch("requests.get")
-def test_failed_get_applications(mock_get, spark_ui_wrapper):
-    # Mocking the response for the GET request
-    endpoint = "/applications?status=running&limit=10000"
-    expected_url = f"https://api.example.com{endpoint}"
+def test_failed_get_applications(requests_mock, spark_ui_wrapper):
     # Invalid response for testing failure
     invalid_response_json = {"invalid_key": "value"}
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = invalid_response_json
-    mock_get.return_value = mock_response
+    requests_mock.get(APPLICATIONS_URL, json=invalid_response_json)
 
     with pytest.raises(jsonschema.exceptions.ValidationError):
         spark_ui_wrapper.get_applications()
 
-    mock_get.assert_called_once_with(expected_url, params=None)
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.url == APPLICATIONS_URL
 
 
-@pytest.mark.parametrize(
-    "applications, expected_ids",
-    [
-        (
-            [
-                {
-                    "id": "app-20231204142916-0004",
-                    "name": "Python Spark SQL data source example",
-                    "attempts": [
-                        {
-                            "startTime": "2023-12-04T14:29:14.422GMT",
-                            "endTime": "1969-12-31T23:59:59.999GMT",
-                            "lastUpdated": "2023-12-04T14:29:14.422GMT",
-                            "duration": 0,
-                            "sparkUser": "root",
-                            "completed": False,
-                            "appSparkVersion": "2.4.1",
-                            "startTimeEpoch": 1701700154422,
-                            "endTimeEpoch": -1,
-                            "lastUpdatedEpoch": 1701700154422,
-                        },
-                    ],
-                },
-                {
-                    "id": "app-20231204142916-0005",
-                    "name": "Python Spark SQL data source example",
-                    "attempts": [
-                        {
-                            "startTime": "2023-12-04T14:30:00.000GMT",
-                            "endTime": "1969-12-31T23:59:59.999GMT",
-                            "lastUpdated": "2023-12-04T14:30:00.000GMT",
-                            "duration": 0,
-                            "sparkUser": "root",
-                            "completed": True,
-                            "appSparkVersion": "2.4.1",
-                            "startTimeEpoch": 1701700200000,
-                            "endTimeEpoch": -1,
-                            "lastUpdatedEpoch": 1701700200000,
-                            "attemptId": "2",  # Optional field
-                        },
-                        {
-                            "startTime": "2023-12-04T14:30:30.000GMT",
-                            "endTime": "1969-12-31T23:59:59.999GMT",
-                            "lastUpdated": "2023-12-04T14:30:30.000GMT",
-                            "duration": 0,
-                            "sparkUser": "root",
-                            "completed": True,
-                            "appSparkVersion": "2.4.1",
-                            "startTimeEpoch": 1701700230000,
-                            "endTimeEpoch": -1,
-                            "lastUpdatedEpoch": 1701700230000,
-                        },
-                    ],
-                },
-            ],
-            [{"app-20231204142916-0004": 0}, {"app-20231204142916-0005": 2}],
-        ),
-    ],
-)
-def test_get_ids_from_applications_case1(applications, expected_ids, spark_ui_wrapper):
-    ids = spark_ui_wrapper.get_ids_from_applications(
-        applications,
-    )
-    print(ids, expected_ids)
-    assert ids == expected_ids
+def test_iter_applications(requests_mock, spark_ui_wrapper):
+    requests_mock.get(APPLICATIONS_URL, json=APPLICATIONS)
 
+    applications = spark_ui_wrapper.iter_applications(apps_limit=10000)
+
+    # Nothing is requested until the stream is consumed
+    assert requests_mock.call_count == 0
+    assert list(applications) == APPLICATIONS
+    assert requests_mock.call_count == 1
 
-@pytest.mark.parametrize(
-    "applications, expected_ids",
-    [
-        (
-            [
-                {
-                    "id": "app-20231204142916-0004",
-                    "name": "Python Spark SQL data source example",
-                    "attempts": [
-                        {
-                            "startTime": "2023-12-04T14:29:14.422GMT",
-                            "endTime": "1969-12-31T23:59:59.999GMT",
-                            "lastUpdated": "2023-12-04T14:29:14.422GMT",
-                            "duration": 0,
-                            "sparkUser": "root",
-                            "completed": True,
-                            "appSparkVersion": "2.4.1",
-                            "startTimeEpoch": 1701700154422,
-                            "endTimeEpoch": -1,
-                            "lastUpdatedEpoch": 1701700154422,
-                            "attemptId": "1",  # Optional field
-                        },
-                    ],
-                },
-                {
-                    "id": "app-20231204142916-0005",
-                    "name": "Python Spark SQL data source example",
-                    "attempts": [
-                        {
-                            "startTime": "2023-12-04T14:30:00.000GMT",
-                            "endTime": "1969-12-31T23:59:59.999GMT",
-                            "lastUpdated": "2023-12-04T14:30:00.000GMT",
-                            "duration": 0,
-                            "sparkUser": "root",
-                            "completed": True,
-                            "appSparkVersion": "2.4.1",
-                            "startTimeEpoch": 1701700200000,
-                            "endTimeEpoch": -1,
-                            "lastUpdatedEpoch": 1701700200000,
-                            "attemptId": "2",  # Optional field
-                        },
-                        {
-                            "startTime": "2023-12-04T14:30:30.000GMT",
-                            "endTime": "1969-12-31T23:59:59.999GMT",
-                            "lastUpdated": "2023-12-04T14:30:30.000GMT",
-                            "duration": 0,
-                            "sparkUser": "root",
-                            "completed": True,
-                            "appSparkVersion": "2.4.1",
-                            "startTimeEpoch": 1701700230000,
-                            "endTimeEpoch": -1,
-                            "lastUpdatedEpoch": 1701700230000,
-                            "attemptId": "1",  # Optional field
-                        },
-                    ],
-                },
-            ],
-            [{"app-20231204142916-0004": 1}, {"app-20231204142916-0005": 2}],
-        ),
-    ],
-)
-def test_get_ids_from_applications_case2(applications, expected_ids, spark_ui_wrapper):
-    ids = spark_ui_wrapper.get_ids_from_applications(
-        applications,
-    )
-    assert ids == expected_ids
+
+def test_failed_iter_applications(requests_mock, spark_ui_wrapper):
+    requests_mock.get(APPLICATIONS_URL, json=[{"invalid_key": "value"}])
+
+    with pytest.raises(jsonschema.exceptions.ValidationError):
+        list(spark_ui_wrapper.iter_applications())
+
+
+def test_iter_applications_non_array_response(requests_mock, spark_ui_wrapper):
+    # An error object instead of the applications array must not be read as "no applications"
+    requests_mock.get(APPLICATIONS_URL, json={"message": "History server is starting"})
+
+    with pytest.raises(jsonschema.exceptions.ValidationError):
+        list(spark_ui_wrapper.iter_applications())
 
 
 @pytest.mark.parametrize(
     "applications, expected_ids",
     [
-        (
+        pytest.param(
+            [RUNNING_APP_WITHOUT_ATTEMPT_ID, RETRIED_APP_WITHOUT_LAST_ATTEMPT_ID],
+            [{"app-20231204142916-0004": 0}, {"app-20231204142916-0005": 2}],
+            id="case1",
+        ),
+        pytest.param(
+            [COMPLETED_APP, RETRIED_APP],
+            [{"app-20231204142916-0004": 1}, {"app-20231204142916-0005": 2}],
+            id="case2",
+        ),
+        pytest.param(
+            [COMPLETED_APP, RETRIED_TWICE_APP],
+            [{"app-20231204142916-0004": 1}, {"app-20231204142916-0005": 3}],
+            id="case3",
+        ),
+        pytest.param(
             [
-                {
-                    "id": "app-20231204142916-0004",
-                    "name": "Python Spark SQL data source example",
-                    "attempts": [
-                        {
-                            "startTime": "2023-12-04T14:29:14.422GMT",
-                            "endTime": "1969-12-31T23:59:59.999GMT",
-                            "lastUpdated": "2023-12-04T14:29:14.422GMT",
-                            "duration": 0,
-                            "sparkUser": "root",
-                            "completed": True,
-                            "appSparkVersion": "2.4.1",
-                            "startTimeEpoch": 1701700154422,
-                            "endTimeEpoch": -1,
-                            "lastUpdatedEpoch": 1701700154422,
-                            "attemptId": "1",  # Optional field
-                        },
-                    ],
-                },
-                {
-                    "id": "app-20231204142916-0005",
-                    "name": "Python Spark SQL data source example",
-                    "attempts": [
-                        {
-                            "startTime": "2023-12-04T14:30:00.000GMT",
-                            "endTime": "1969-12-31T23:59:59.999GMT",
-                            "lastUpdated": "2023-12-04T14:30:00.000GMT",
-                            "duration": 0,
-                            "sparkUser": "root",
-                            "completed": True,
-                            "appSparkVersion": "2.4.1",
-                            "startTimeEpoch": 1701700200000,
-                            "endTimeEpoch": -1,
-                            "lastUpdatedEpoch": 1701700200000,
-                            "attemptId": "1",  # Optional field
-                        },
-                        {
-                            "startTime": "2023-12-04T14:30:30.000GMT",
-                            "endTime": "1969-12-31T23:59:59.999GMT",
-                            "lastUpdated": "2023-12-04T14:30:30.000GMT",
-                            "duration": 0,
-                            "sparkUser": "root",
-                            "completed": True,
-                            "appSparkVersion": "2.4.1",
-                            "startTimeEpoch": 1701700230000,
-                            "endTimeEpoch": -1,
-                            "lastUpdatedEpoch": 1701700230000,
-                            "attemptId": "2",  # Optional field
-                        },
-                        {
-                            "startTime": "2023-12-04T14:30:30.000GMT",
-                            "endTime": "1969-12-31T23:59:59.999GMT",
-                            "lastUpdated": "2023-12-04T14:30:30.000GMT",
-                            "duration": 0,
-                            "sparkUser": "root",
-                            "completed": True,
-                            "appSparkVersion": "2.4.1",
-                            "startTimeEpoch": 1701700230000,
-                            "endTimeEpoch": -1,
-                            "lastUpdatedEpoch": 1701700230000,
-                            "attemptId": "3",  # Optional field
-                        },
-                    ],
-                },
+                build_application("app-20231204142916-00041", [build_attempt(*FIRST_ATTEMPT, attempt_id="1")]),
+                build_application("app-20231204142916-00051", [build_attempt(*SECOND_ATTEMPT)]),
             ],
-            [{"app-20231204142916-0004": 1}, {"app-20231204142916-0005": 3}],
+            [{"app-20231204142916-00041": 1}, {"app-20231204142916-00051": 0}],
+            id="case5",
         ),
     ],
 )
-def test_get_ids_from_applications_case3(applications, expected_ids, spark_ui_wrapper):
+def test_get_ids_from_applications(applications, expected_ids, spark_ui_wrapper):
     ids = spark_ui_wrapper.get_ids_from_applications(
         applications,
     )
@@ -321,57 +161,15 @@ def test_get_ids_from_applications_case3(applications, expected_ids, spark_ui_wr
 
 
 @pytest.mark.parametrize(
-    "applications, expected_ids",
+    "filter_users_pattern, expected_ids",
     [
-        (
-            [
-                {
-                    "id": "app-20231204142916-00041",
-                    "name": "Python Spark SQL data source example",
-                    "attempts": [
-                        {
-                            "startTime": "2023-12-04T14:29:14.422GMT",
-                            "endTime": "1969-12-31T23:59:59.999GMT",
-                            "lastUpdated": "2023-12-04T14:29:14.422GMT",
-                            "duration": 0,
-                            "sparkUser": "root",
-                            "completed": True,
-                            "appSparkVersion": "2.4.1",
-                            "startTimeEpoch": 1701700154422,
-                            "endTimeEpoch": -1,
-                            "lastUpdatedEpoch": 1701700154422,
-                            "attemptId": "1",  # Optional field
-                        },
-                    ],
-                },
-                {
-                    "id": "app-20231204142916-00051",
-                    "name": "Python Spark SQL data source example",
-                    "attempts": [
-                        {
-                            "startTime": "2023-12-04T14:30:00.000GMT",
-                            "endTime": "1969-12-31T23:59:59.999GMT",
-                            "lastUpdated": "2023-12-04T14:30:00.000GMT",
-                            "duration": 0,
-                            "sparkUser": "root",
-                            "completed": True,
-                            "appSparkVersion": "2.4.1",
-                            "startTimeEpoch": 1701700200000,
-                            "endTimeEpoch": -1,
-                            "lastUpdatedEpoch": 1701700200000,
-                        },
-                    ],
-                },
-            ],
-            [{"app-20231204142916-00041": 1}, {"app-20231204142916-00051": 0}],
-        ),
+        ("", [{"app-20231204142916-0004": 1}, {"app-20231204142916-0005": 2}]),
+        ("ro+t", [{"app-20231204142916-0004": 1}, {"app-20231204142916-0005": 2}]),
+        ("spark", []),
     ],
 )
-def test_get_ids_from_applications_case5(applications, expected_ids, spark_ui_wrapper):
-    ids = spark_ui_wrapper.get_ids_from_applications(
-        applications,
-    )
-    print(ids, expected_ids)
+def test_get_ids_from_applications_filter_users(filter_users_pattern, expected_ids, spark_ui_wrapper):
+    ids = spark_ui_wrapper.get_ids_from_applications(APPLICATIONS, filter_users_pattern=filter_users_pattern)
     assert ids == expected_ids
 
 
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from spark_tunning_ml.config import config
+from spark_tunning_ml.vectors import PROPERTY_DEFAULT_VALUE_STRING, Vectors, _parse_env
+
+ENVIRONMENT = {
+    "spark.app.id": "application_1",
+    "spark.app.name": "test-app",
+    "spark.executor.memory": "4g",
+    "spark.driver.memory": "1024m",
+    "spark.dynamicAllocation.enabled": "true",
+    "user.name": "spark",
+}
+
+
+def build_task(task_id, run_time):
+    task_metrics = {}
+    for column in config.get("internal_vector_tasks_agg_columns"):
+        metric = column.split(".")[1:]
+        parent = task_metrics
+        for key in metric[:-1]:
+            parent = parent.setdefault(key, {})
+        parent[metric[-1]] = run_time
+
+    return {"taskId": task_id, "status": "SUCCESS", "taskMetrics": task_metrics}
+
+
+def build_stage(stage_id, run_times):
+    stage = {key: 0 for key in config.get("internal_vector_stage_columns")}
+    stage.update(
+        {
+            "status": "COMPLETE",
+            "stageId": stage_id,
+            "name": f"stage {stage_id}",
+            "firstTaskLaunchedTime": "2023-12-04T14:29:14.422GMT",
+            "completionTime": "2023-12-04T14:30:20.999GMT",
+            "executorSummary": {"1": {}, "2": {}},
+            "tasks": {str(i): build_task(i, run_time) for i, run_time in enumerate(run_times)},
+        }
+    )
+    return stage
+
+
+@pytest.fixture
+def applications(tmp_path):
+    app_path = tmp_path / "applications" / "application_1"
+
+    environment_path = app_path / config.get("spark_ui_path_environment")
+    environment_path.mkdir(parents=True)
+    (environment_path / "environment.json").write_text(json.dumps([ENVIRONMENT]))
+
+    stage_path = app_path / config.get("spark_ui_path_stage_info")
+    stage_path.mkdir(parents=True)
+    (stage_path / "stage-0.json").write_text(json.dumps([build_stage(0, [1, 3])]))
+    (stage_path / "stage-1.json").write_text(json.dumps([build_stage(1, [5])]))
+
+    return tmp_path / "applications"
+
+
+def test_build_vector(applications, tmp_path):
+    path_vector = tmp_path / "vectors"
+    path_vector.mkdir()
+
+    result = Vectors().build_vector(["application_1"], str(applications), str(path_vector), max_workers=1)
+
+    assert result == ["application_1"]
+
+    df = pd.read_csv(path_vector / "application_1.csv")
+
+    assert sorted(df["stageId"]) == [0, 1]
+    assert df["totalTimeSec"].tolist() == [66, 66]
+    assert df["sparkExecutorMemory"].tolist() == [4 * 1024**3] * 2
+    assert df["numExecutorsAssocStage"].tolist() == [2, 2]
+    assert df.set_index("stageId")["taskMetrics_executorRunTime_sum_agg"].to_dict() == {0: 4, 1: 5}
+
+
+def test_build_vector_skips_malformed_stage(applications, tmp_path):
+    path_vector = tmp_path / "vectors"
+    path_vector.mkdir()
+
+    stage = build_stage(2, [7])
+    stage["executorSummary"] = None
+    stage_path = applications / "application_1" / config.get("spark_ui_path_stage_info")
+    (stage_path / "stage-2.json").write_text(json.dumps([stage]))
+
+    Vectors().build_vector(["application_1"], str(applications), str(path_vector), max_workers=1)
+
+    df = pd.read_csv(path_vector / "application_1.csv")
+
+    assert sorted(df["stageId"]) == [0, 1]
+
+
+def test_build_vector_without_environment(applications, tmp_path):
+    path_vector = tmp_path / "vectors"
+    path_vector.mkdir()
+
+    result = Vectors().build_vector(["application_2"], str(applications), str(path_vector), max_workers=1)
+
+    assert result == ["application_2"]
+    assert os.listdir(path_vector) == []
+
+
+def test_parse_env_defaults():
+    env = _parse_env({"spark.app.id": "application_1", "spark.app.name": "test-app"})
+
+    assert env.spark_app_id == "application_1"
+    assert env.spark_tags == PROPERTY_DEFAULT_VALUE_STRING
+    assert env.spark_executor_memory == 0
+    assert env.spark_dynamic_allocation == 0
+
+
+def test_read_and_concatenate_batch_mixed_types(tmp_path):
+    # Unset idle timeouts default to 0 while set ones keep their unit, so one column can be int in one file
+    # and string in another
+    paths = [str(tmp_path / "app_1.csv"), str(tmp_path / "app_2.csv")]
+    pd.DataFrame({"stageId": [0], "dynamicAllocationExecutorsIdleTimeout": [0]}).to_csv(paths[0], index=False)
+    pd.DataFrame({"stageId": [1], "dynamicAllocationExecutorsIdleTimeout": ["60s"]}).to_csv(paths[1], index=False)
+
+    df = Vectors().read_and_concatenate_batch(paths)
+
+    assert df["stageId"].tolist() == [0, 1]
+    assert df["dynamicAllocationExecutorsIdleTimeout"].tolist() == [0, "60s"]